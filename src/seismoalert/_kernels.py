@@ -0,0 +1,271 @@
+"""Numerical kernels backing the statistical analysis routines.
+
+When Numba is installed (``pip install seismoalert[fast]``) the loop kernels
+are JIT-compiled to native code for large inputs; otherwise, and for inputs
+too small to amortize compilation, equivalent NumPy implementations are
+used. Numba itself is only imported the first time a kernel needs it, so
+short CLI invocations never pay its import or compilation cost. Callers
+should only use the public functions of this module and never depend on
+which backend is active.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import types
+from collections.abc import Callable
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+# Loop kernels run as plain Python with ``range``; _jit compiles parallel
+# kernels against numba.prange instead
+prange = range
+
+# Minimum input size for which JIT compilation is worth its one-off cost
+_JIT_MIN_EVENTS = 5_000
+
+# Upper bound on candidate pairs materialized at once by the NumPy path
+_PAIR_CHUNK = 1_000_000
+
+
+def _haversine_km_vec(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Element-wise Haversine distance in kilometers for radian inputs."""
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _count_clustered_numpy(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    t: np.ndarray,
+    radius_km: float,
+    window_s: float,
+) -> int:
+    """NumPy implementation of :func:`count_clustered` for time-sorted input.
+
+    Only pairs inside the time window are ever distance-checked, so the work
+    is O(N * k) for an average of k temporal neighbors rather than O(N^2).
+    """
+    n = t.shape[0]
+    max_dlat = radius_km / EARTH_RADIUS_KM
+    # Event i is paired with events i+1 .. hi[i]-1 (all within the window)
+    hi = np.searchsorted(t, t + window_s, side="right")
+    lengths = hi - np.arange(n) - 1
+    ends = np.cumsum(lengths)
+
+    clustered = 0
+    row = 0
+    while row < n:
+        # Take as many rows as fit in one chunk of candidate pairs
+        base = ends[row - 1] if row else 0
+        stop = max(row + 1, int(np.searchsorted(ends, base + _PAIR_CHUNK, "right")))
+        rows = np.arange(row, stop)
+        counts = lengths[row:stop]
+        i_idx = np.repeat(rows, counts)
+        first = np.repeat(ends[row:stop] - counts - base, counts)
+        j_idx = i_idx + 1 + (np.arange(i_idx.size) - first)
+        # Only pairs whose latitude difference is within the radius can match
+        near = np.abs(lat[j_idx] - lat[i_idx]) <= max_dlat
+        i_idx, j_idx = i_idx[near], j_idx[near]
+        dist = _haversine_km_vec(lat[i_idx], lon[i_idx], lat[j_idx], lon[j_idx])
+        clustered += int(np.count_nonzero(dist <= radius_km))
+        row = stop
+    return clustered
+
+
+def _count_clustered_loop(lat, lon, t, radius_km, window_s):
+    """Explicit-loop implementation of :func:`count_clustered` for Numba.
+
+    Expects time-sorted input and uses O(1) extra memory.
+    """
+    n = lat.shape[0]
+    max_dlat = radius_km / EARTH_RADIUS_KM
+    total = 0
+    for i in prange(n):
+        count = 0
+        cos_i = math.cos(lat[i])
+        for j in range(i + 1, n):
+            if t[j] - t[i] > window_s:
+                break
+            # The latitude difference alone bounds the distance from below
+            if abs(lat[j] - lat[i]) > max_dlat:
+                continue
+            sin_dlat = math.sin((lat[j] - lat[i]) / 2)
+            sin_dlon = math.sin((lon[j] - lon[i]) / 2)
+            a = sin_dlat * sin_dlat + cos_i * math.cos(lat[j]) * sin_dlon * sin_dlon
+            a = min(max(a, 0.0), 1.0)
+            if 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)) <= radius_km:
+                count += 1
+        total += count
+    return total
+
+
+@functools.cache
+def _jit(py_func: Callable, parallel: bool = False) -> Callable | None:
+    """Compile a loop kernel with Numba on first use.
+
+    Args:
+        py_func: Pure-Python kernel written in the Numba-compatible subset.
+        parallel: Whether ``prange`` loops should run in parallel.
+
+    Returns:
+        The compiled kernel, or None if Numba is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    if parallel:
+        # Compile a copy whose globals bind numba.prange, leaving this
+        # module's ``prange`` untouched.
+        py_func = types.FunctionType(
+            py_func.__code__,
+            {**py_func.__globals__, "prange": numba.prange},
+            py_func.__name__,
+            py_func.__defaults__,
+            py_func.__closure__,
+        )
+    return numba.njit(parallel=parallel, fastmath=True, cache=True)(py_func)
+
+
+def count_clustered(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    t: np.ndarray,
+    radius_km: float,
+    window_s: float,
+) -> int:
+    """Count event pairs that are close in both space and time.
+
+    Args:
+        lat: Latitudes in radians.
+        lon: Longitudes in radians.
+        t: Event times in seconds (any common epoch).
+        radius_km: Maximum great-circle distance in kilometers.
+        window_s: Maximum absolute time difference in seconds.
+
+    Returns:
+        Number of unordered pairs ``(i, j)`` within both thresholds.
+    """
+    order = np.argsort(t, kind="stable")
+    kernel = None
+    if order.size >= _JIT_MIN_EVENTS:
+        kernel = _jit(_count_clustered_loop, parallel=True)
+    if kernel is None:
+        kernel = _count_clustered_numpy
+    return int(
+        kernel(
+            np.ascontiguousarray(np.asarray(lat, dtype=np.float64)[order]),
+            np.ascontiguousarray(np.asarray(lon, dtype=np.float64)[order]),
+            np.ascontiguousarray(np.asarray(t, dtype=np.float64)[order]),
+            float(radius_km),
+            float(window_s),
+        )
+    )
+
+
+def _window_ends_loop(t, window_s):
+    """Two-pointer implementation of :func:`window_ends` for Numba."""
+    n = t.shape[0]
+    ends = np.empty(n, dtype=np.int64)
+    j = 0
+    for i in range(n):
+        if j < i:
+            j = i
+        while j + 1 < n and t[j + 1] <= t[i] + window_s:
+            j += 1
+        ends[i] = j
+    return ends
+
+
+def window_ends(t: np.ndarray, window_s: float) -> np.ndarray:
+    """Find the last event inside the window that starts at each event.
+
+    Args:
+        t: Event times in seconds, sorted in ascending order.
+        window_s: Window length in seconds.
+
+    Returns:
+        Integer array whose element ``i`` is the largest index ``j`` with
+        ``t[j] <= t[i] + window_s``.
+    """
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    if t.size >= _JIT_MIN_EVENTS:
+        kernel = _jit(_window_ends_loop)
+        if kernel is not None:
+            return kernel(t, float(window_s))
+    return np.searchsorted(t, t + window_s, side="right") - 1
+
+
+def _magnitude_moments_loop(mags, mc):
+    """Single-pass (Welford) implementation of :func:`magnitude_moments`."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(mags.shape[0]):
+        m = mags[i]
+        if m >= mc:
+            n += 1
+            delta = m - mean
+            mean += delta / n
+            m2 += delta * (m - mean)
+    return n, mean, m2
+
+
+def magnitude_moments(mags: np.ndarray, mc: float) -> tuple[int, float, float]:
+    """Count, mean and sum of squared deviations of magnitudes at or above Mc.
+
+    Args:
+        mags: Event magnitudes in any order.
+        mc: Magnitude of completeness; smaller magnitudes are ignored.
+
+    Returns:
+        ``(n, mean, m2)`` where ``m2`` is the sum of squared deviations from
+        the mean. ``mean`` and ``m2`` are 0.0 when ``n`` is 0.
+    """
+    mags = np.ascontiguousarray(mags, dtype=np.float64)
+    if mags.size >= _JIT_MIN_EVENTS:
+        kernel = _jit(_magnitude_moments_loop)
+        if kernel is not None:
+            n, mean, m2 = kernel(mags, float(mc))
+            return int(n), float(mean), float(m2)
+    selected = mags[mags >= mc]
+    if selected.size == 0:
+        return 0, 0.0, 0.0
+    mean = selected.mean()
+    return int(selected.size), float(mean), float(np.square(selected - mean).sum())
+
+
+def warmup() -> bool:
+    """Compile every Numba kernel now rather than on its first large input.
+
+    Useful before timing-sensitive work such as a test session or a
+    benchmark. Does nothing when Numba is not installed.
+
+    Returns:
+        True if the kernels were compiled, False if Numba is unavailable.
+    """
+    # Numba compiles separate versions for writable and read-only arrays,
+    # and catalog columns are read-only, so warm up with both.
+    x = np.arange(4, dtype=np.float64)
+    ro = x.copy()
+    ro.setflags(write=False)
+    kernels = (
+        (_jit(_count_clustered_loop, parallel=True), lambda a: (a, a, a, 1.0, 1.0)),
+        (_jit(_window_ends_loop), lambda a: (a, 1.0)),
+        (_jit(_magnitude_moments_loop), lambda a: (a, 1.0)),
+    )
+    for kernel, args in kernels:
+        if kernel is None:
+            return False
+        kernel(*args(x))
+        kernel(*args(ro))
+    return True
@@ -32,21 +32,31 @@
                     │
 5. Optionally send via stubs
     │
-    WebhookAlert.send(alert)  → logs it
-    EmailAlert.send(alert)    → logs it
+    WebhookAlert.send(alert)  → logs it, delivers in the background
+    EmailAlert.send(alert)    → logs it, delivers in the background
 
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
+import string
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 from seismoalert.models import EarthquakeCatalog
 
 logger = logging.getLogger(__name__)
 
+# Message template fields that are filled in from a CatalogSummary
+_SUMMARY_FIELDS = frozenset({"count", "max_mag"})
+
+# Maximum number of alerts delivered concurrently
+_SEND_WORKERS = 4
+
 
 @dataclass
 class Alert:
@@ -61,6 +71,52 @@ class Alert:
     message: str
 
 
+@dataclass(frozen=True)
+class CatalogSummary:
+    """Scalar catalog statistics shared by summary-based conditions.
+
+    Attributes:
+        count: Number of events in the catalog.
+        max_magnitude: Largest magnitude, or None if the catalog is empty.
+    """
+
+    count: int
+    max_magnitude: float | None
+
+    @classmethod
+    def from_catalog(cls, catalog: EarthquakeCatalog) -> CatalogSummary:
+        """Summarize a catalog in at most one pass over its magnitudes.
+
+        Args:
+            catalog: Earthquake catalog to summarize.
+
+        Returns:
+            A CatalogSummary instance.
+        """
+        # max_magnitude is cached on the (immutable) catalog, so summarizing
+        # the same catalog again is O(1).
+        return cls(count=len(catalog), max_magnitude=catalog.max_magnitude)
+
+
+@dataclass(frozen=True)
+class SummaryCondition:
+    """A condition that only depends on a CatalogSummary.
+
+    Instances are callable on a catalog like any other condition, but
+    AlertManager.evaluate can check them against a summary that is
+    computed once for all rules.
+
+    Attributes:
+        predicate: Callable that takes a CatalogSummary
+            and returns True if triggered.
+    """
+
+    predicate: Callable[[CatalogSummary], bool]
+
+    def __call__(self, catalog: EarthquakeCatalog) -> bool:
+        return self.predicate(CatalogSummary.from_catalog(catalog))
+
+
 @dataclass
 class AlertRule:
     """A configurable alert rule.
@@ -70,36 +126,80 @@ class AlertRule:
         condition: Callable that takes an EarthquakeCatalog
             and returns True if triggered.
         message_template: Format string for the alert message.
-            Receives the catalog as 'catalog'.
+            May reference the ``{count}`` and ``{max_mag}`` fields.
     """
 
     name: str
     condition: Callable[[EarthquakeCatalog], bool]
     message_template: str
 
-    def evaluate(self, catalog: EarthquakeCatalog) -> Alert | None:
+    @property
+    def uses_summary(self) -> bool:
+        """Whether the condition or the message depends on catalog statistics.
+
+        A malformed template counts as using the summary; its error is
+        raised only if the rule triggers and the message is formatted.
+        """
+        if isinstance(self.condition, SummaryCondition):
+            return True
+        try:
+            fields = _template_fields(self.message_template)
+        except ValueError:
+            return True
+        return bool(fields & _SUMMARY_FIELDS)
+
+    def evaluate(
+        self,
+        catalog: EarthquakeCatalog,
+        summary: CatalogSummary | None = None,
+    ) -> Alert | None:
         """Evaluate the rule against a catalog.
 
         Args:
             catalog: Earthquake catalog to check.
+            summary: Precomputed summary of ``catalog``. When given, it is
+                used for SummaryCondition checks and message fields instead
+                of recomputing statistics from the catalog.
 
         Returns:
             An Alert if the condition is met, None otherwise.
         """
-        if self.condition(catalog):
-            message = self.message_template.format(
-                count=len(catalog),
-                max_mag=catalog.max_magnitude,
+        if summary is not None and isinstance(self.condition, SummaryCondition):
+            triggered = self.condition.predicate(summary)
+        else:
+            triggered = self.condition(catalog)
+        if not triggered:
+            return None
+
+        # Only compute the catalog statistics the message actually references.
+        fields = _template_fields(self.message_template)
+        values = {}
+        if "count" in fields:
+            values["count"] = summary.count if summary is not None else len(catalog)
+        if "max_mag" in fields:
+            values["max_mag"] = (
+                summary.max_magnitude if summary is not None else catalog.max_magnitude
             )
-            return Alert(rule_name=self.name, message=message)
-        return None
+        message = self.message_template.format_map(values)
+        return Alert(rule_name=self.name, message=message)
+
 
+@functools.lru_cache(maxsize=128)
+def _template_fields(template: str) -> frozenset[str]:
+    """Top-level field names referenced by a ``str.format`` template."""
+    return frozenset(
+        re.split(r"[.\[]", field_name, maxsplit=1)[0]
+        for _, field_name, _, _ in string.Formatter().parse(template)
+        if field_name is not None
+    )
 
-def large_earthquake_condition(
-    min_magnitude: float,
-) -> Callable[[EarthquakeCatalog], bool]:
+
+@functools.lru_cache(maxsize=128)
+def large_earthquake_condition(min_magnitude: float) -> SummaryCondition:
     """Create a condition that triggers when any event exceeds a magnitude threshold.
 
+    Conditions are cached, so equal thresholds share one instance.
+
     Args:
         min_magnitude: Magnitude threshold.
 
@@ -107,15 +207,19 @@ def large_earthquake_condition(
         Condition callable.
     """
 
-    def condition(catalog: EarthquakeCatalog) -> bool:
-        return any(eq.magnitude >= min_magnitude for eq in catalog)
+    def predicate(summary: CatalogSummary) -> bool:
+        max_mag = summary.max_magnitude
+        return max_mag is not None and max_mag >= min_magnitude
 
-    return condition
+    return SummaryCondition(predicate)
 
 
-def high_rate_condition(max_count: int) -> Callable[[EarthquakeCatalog], bool]:
+@functools.lru_cache(maxsize=128)
+def high_rate_condition(max_count: int) -> SummaryCondition:
     """Create a condition that triggers when event count exceeds a threshold.
 
+    Conditions are cached, so equal thresholds share one instance.
+
     Args:
         max_count: Maximum event count before triggering.
 
@@ -123,10 +227,10 @@ def high_rate_condition(max_count: int) -> Callable[[EarthquakeCatalog], bool]:
         Condition callable.
     """
 
-    def condition(catalog: EarthquakeCatalog) -> bool:
-        return len(catalog) > max_count
+    def predicate(summary: CatalogSummary) -> bool:
+        return summary.count > max_count
 
-    return condition
+    return SummaryCondition(predicate)
 
 
 @dataclass
@@ -147,21 +251,73 @@ class AlertManager:
         """
         self.rules.append(rule)
 
-    def evaluate(self, catalog: EarthquakeCatalog) -> list[Alert]:
+    def evaluate(
+        self, catalog: EarthquakeCatalog, parallel: bool = False
+    ) -> list[Alert]:
         """Evaluate all rules against a catalog.
 
+        If any rule needs them, the catalog's event count and maximum
+        magnitude are computed once up front and shared by every rule: rules
+        built from a SummaryCondition (such as ``large_earthquake_condition``
+        and ``high_rate_condition``) and all message templates use them
+        instead of re-reading the catalog. Other conditions are called on
+        the catalog as usual.
+
         Args:
             catalog: Earthquake catalog to check.
+            parallel: If True, evaluate rules concurrently in a thread pool.
+                Useful when conditions block on I/O or call into code that
+                releases the GIL; alerts are still returned in rule order.
 
         Returns:
             List of triggered Alert objects.
         """
-        alerts = []
-        for rule in self.rules:
-            alert = rule.evaluate(catalog)
-            if alert is not None:
-                alerts.append(alert)
-        return alerts
+        if not self.rules:
+            return []
+        summary = None
+        if any(rule.uses_summary for rule in self.rules):
+            summary = CatalogSummary.from_catalog(catalog)
+        if parallel and len(self.rules) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.rules))) as pool:
+                results = list(
+                    pool.map(lambda r: r.evaluate(catalog, summary), self.rules)
+                )
+        else:
+            results = [rule.evaluate(catalog, summary) for rule in self.rules]
+        return [alert for alert in results if alert is not None]
+
+
+@functools.cache
+def _send_pool() -> ThreadPoolExecutor:
+    """Shared pool that delivers alerts in the background, created on first use.
+
+    Python joins the pool's worker threads at interpreter exit, so alerts
+    that are still queued are delivered before the process ends.
+    """
+    return ThreadPoolExecutor(
+        max_workers=_SEND_WORKERS, thread_name_prefix="seismoalert-send"
+    )
+
+
+def _submit_delivery(deliver: Callable[[Alert], None], alert: Alert) -> Future[None]:
+    """Run ``deliver(alert)`` on the send pool, logging it if delivery fails."""
+    future = _send_pool().submit(deliver, alert)
+    future.add_done_callback(functools.partial(_log_delivery_failure, alert))
+    return future
+
+
+def _log_delivery_failure(alert: Alert, future: Future[None]) -> None:
+    """Log the exception of a failed delivery, which callers rarely inspect."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error(
+            "Failed to deliver alert [%s]: %s",
+            alert.rule_name,
+            exc,
+            exc_info=exc,
+        )
 
 
 class WebhookAlert:
@@ -177,11 +333,17 @@ class WebhookAlert:
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
 
-    def send(self, alert: Alert) -> None:
+    def send(self, alert: Alert) -> Future[None]:
         """Send an alert via webhook (stub).
 
+        The alert is logged immediately and delivered on a background
+        thread, so the call never blocks on the network.
+
         Args:
             alert: The alert to send.
+
+        Returns:
+            Future that completes once the alert has been delivered.
         """
         logger.info(
             "Webhook alert [%s]: %s -> %s",
@@ -189,6 +351,10 @@ class WebhookAlert:
             alert.message,
             self.webhook_url,
         )
+        return _submit_delivery(self._deliver, alert)
+
+    def _deliver(self, alert: Alert) -> None:
+        """Deliver an alert; a real implementation would POST it here."""
 
 
 class EmailAlert:
@@ -204,11 +370,17 @@ class EmailAlert:
     def __init__(self, recipient: str):
         self.recipient = recipient
 
-    def send(self, alert: Alert) -> None:
+    def send(self, alert: Alert) -> Future[None]:
         """Send an alert via email (stub).
 
+        The alert is logged immediately and delivered on a background
+        thread, so the call never blocks on the mail server.
+
         Args:
             alert: The alert to send.
+
+        Returns:
+            Future that completes once the alert has been delivered.
         """
         logger.info(
             "Email alert to %s - Subject: [SeismoAlert] %s - Body: %s",
@@ -216,3 +388,7 @@ class EmailAlert:
             alert.rule_name,
             alert.message,
         )
+        return _submit_delivery(self._deliver, alert)
+
+    def _deliver(self, alert: Alert) -> None:
+        """Deliver an alert; a real implementation would send the email here."""
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from datetime import timedelta
 
 import numpy as np
 
+from seismoalert._kernels import count_clustered, magnitude_moments, window_ends
 from seismoalert.models import EarthquakeCatalog
 
 
@@ -21,11 +22,13 @@ class GutenbergRichterResult:
         a_value: Productivity parameter (log10 of total event rate).
         b_value: Slope of the frequency-magnitude distribution.
         mc: Magnitude of completeness used for the fit.
+        b_error: Shi & Bolt (1982) standard error of the b-value.
     """
 
     a_value: float
     b_value: float
     mc: float
+    b_error: float = 0.0
 
 
 @dataclass
@@ -65,15 +68,23 @@ def magnitude_of_completeness(catalog: EarthquakeCatalog) -> float:
     if len(catalog) == 0:
         raise ValueError("Cannot compute Mc for an empty catalog")
 
-    mags = np.array(catalog.magnitudes)
-    # Round to nearest 0.1 for binning
-    bin_min = np.floor(mags.min() * 10) / 10
-    bin_max = np.ceil(mags.max() * 10) / 10 + 0.1
-    bins = np.arange(bin_min, bin_max, 0.1)
-    counts, bin_edges = np.histogram(mags, bins=bins)
-    max_idx = np.argmax(counts)
-    mc = (bin_edges[max_idx] + bin_edges[max_idx + 1]) / 2
-    return round(float(mc), 1)
+    return _mc_from_mags(catalog.magnitudes_array)
+
+
+def _mc_from_mags(mags: np.ndarray) -> float:
+    """Max-curvature Mc of a non-empty magnitude array."""
+    # Quantize to 0.1-magnitude bins centered on multiples of 0.1, rounding
+    # halves up (np.rint rounds them to even, which biases two-decimal USGS
+    # magnitudes towards even tenths). The epsilon absorbs float noise such
+    # as 2.05 * 10 == 20.499999999999996. Work in place so only one temporary
+    # float array is allocated.
+    scaled = mags * 10
+    scaled += 0.5 + 1e-9
+    idx = np.floor(scaled, out=scaled).astype(np.int64)
+    offset = int(idx.min())
+    counts = np.bincount(idx - offset)
+    max_idx = int(np.argmax(counts))
+    return round((max_idx + offset) / 10, 1)
 
 
 def gutenberg_richter(
@@ -97,28 +108,30 @@ def gutenberg_richter(
     if len(catalog) == 0:
         raise ValueError("Cannot fit G-R law to an empty catalog")
 
+    mags_all = catalog.magnitudes_array
     if mc is None:
-        mc = magnitude_of_completeness(catalog)
-
-    filtered = catalog.filter_by_magnitude(min_mag=mc)
-    if len(filtered) < 2:
-        raise ValueError(f"Insufficient events (n={len(filtered)}) above Mc={mc}")
+        mc = _mc_from_mags(mags_all)
 
-    mags = np.array(filtered.magnitudes)
-    mean_mag = np.mean(mags)
+    n, mean_mag, m2 = magnitude_moments(mags_all, mc)
+    if n < 2:
+        raise ValueError(f"Insufficient events (n={n}) above Mc={mc}")
 
     # Aki (1965) maximum likelihood b-value estimator
     # bin width correction: delta_m = 0.1
     delta_m = 0.1
-    b_value = np.log10(np.e) / (mean_mag - (mc - delta_m / 2))
+    b_value = math.log10(math.e) / (mean_mag - (mc - delta_m / 2))
+
+    # Shi & Bolt (1982) uncertainty: 2.3 * b^2 * std error of the mean
+    b_error = 2.3 * b_value**2 * math.sqrt(m2 / (n * (n - 1)))
 
     # a-value: log10(N) = a - b * Mc
-    a_value = np.log10(len(filtered)) + b_value * mc
+    a_value = math.log10(n) + b_value * mc
 
     return GutenbergRichterResult(
-        a_value=round(float(a_value), 3),
-        b_value=round(float(b_value), 3),
+        a_value=round(a_value, 3),
+        b_value=round(b_value, 3),
         mc=mc,
+        b_error=round(b_error, 3),
     )
 
 
@@ -137,10 +150,10 @@ def interevent_times(catalog: EarthquakeCatalog) -> np.ndarray:
     if len(catalog) < 2:
         raise ValueError("Need at least 2 events to compute inter-event times")
 
-    sorted_cat = catalog.sort_by_time()
-    times = [eq.time for eq in sorted_cat]
-    deltas = [(times[i + 1] - times[i]).total_seconds() for i in range(len(times) - 1)]
-    return np.array(deltas)
+    # Differencing integer microseconds is exact; differencing float epoch
+    # seconds would lose sub-millisecond precision at present-day epochs.
+    times_us = np.sort(catalog.times.view(np.int64))
+    return np.diff(times_us) / 1e6
 
 
 def detect_anomalies(
@@ -164,47 +177,34 @@ def detect_anomalies(
     if len(catalog) < 2:
         return []
 
-    sorted_cat = catalog.sort_by_time()
-    events = sorted_cat.earthquakes
-    window = timedelta(days=window_days)
-
-    # Count events in each sliding window
-    window_counts = []
-    window_indices = []
-    for i, eq in enumerate(events):
-        window_end = eq.time + window
-        count = sum(1 for e in events[i:] if e.time <= window_end)
-        window_counts.append(count)
-        # Find end index
-        end_idx = i
-        for j in range(i, len(events)):
-            if events[j].time <= window_end:
-                end_idx = j
-            else:
-                break
-        window_indices.append((i, end_idx))
-
-    counts_arr = np.array(window_counts, dtype=float)
-    mean_count = np.mean(counts_arr)
-    std_count = np.std(counts_arr)
+    # Only the times are needed, so sort that one column rather than the
+    # whole catalog; AnomalyPeriod indices refer to this time-sorted order.
+    t = np.sort(catalog.epoch_seconds)
+
+    # Times are sorted, so each window [t_i, t_i + window] ends at the
+    # last index whose time does not exceed its upper bound.
+    starts = np.arange(len(t))
+    ends = window_ends(t, window_days * 86400.0)
+    counts = ends - starts + 1
+
+    mean_count = np.mean(counts)
+    std_count = np.std(counts)
 
     if std_count == 0:
         return []
 
+    sigma_devs = (counts - mean_count) / std_count
     anomalies = []
-    for i, count in enumerate(window_counts):
-        sigma_dev = (count - mean_count) / std_count
-        if sigma_dev >= threshold_sigma:
-            start_idx, end_idx = window_indices[i]
-            anomalies.append(
-                AnomalyPeriod(
-                    start_index=start_idx,
-                    end_index=end_idx,
-                    event_count=count,
-                    expected_count=round(mean_count, 1),
-                    sigma_deviation=round(float(sigma_dev), 2),
-                )
+    for i in np.flatnonzero(sigma_devs >= threshold_sigma):
+        anomalies.append(
+            AnomalyPeriod(
+                start_index=int(starts[i]),
+                end_index=int(ends[i]),
+                event_count=int(counts[i]),
+                expected_count=round(mean_count, 1),
+                sigma_deviation=round(float(sigma_devs[i]), 2),
             )
+        )
 
     return anomalies
 
@@ -230,40 +230,13 @@ def clustering_coefficient(
     if len(catalog) < 2:
         return 0.0
 
-    events = catalog.earthquakes
-    n = len(events)
+    n = len(catalog)
     total_pairs = n * (n - 1) / 2
-    clustered_pairs = 0
-
-    time_window = timedelta(hours=time_window_hours)
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Temporal check
-            time_diff = abs(events[i].time - events[j].time)
-            if time_diff > time_window:
-                continue
-
-            # Spatial check (approximate distance using Haversine)
-            dist = _haversine_km(
-                events[i].latitude,
-                events[i].longitude,
-                events[j].latitude,
-                events[j].longitude,
-            )
-            if dist <= radius_km:
-                clustered_pairs += 1
-
-    return clustered_pairs / total_pairs
 
+    lat = np.radians(catalog.latitudes)
+    lon = np.radians(catalog.longitudes)
+    clustered_pairs = count_clustered(
+        lat, lon, catalog.epoch_seconds, radius_km, time_window_hours * 3600.0
+    )
 
-def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Compute the Haversine distance between two points in kilometers."""
-    r = 6371.0  # Earth radius in km
-    dlat = np.radians(lat2 - lat1)
-    dlon = np.radians(lon2 - lon1)
-    a = np.sin(dlat / 2) ** 2 + np.cos(np.radians(lat1)) * np.cos(
-        np.radians(lat2)
-    ) * np.sin(dlon / 2) ** 2
-    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
-    return float(r * c)
+    return clustered_pairs / total_pairs
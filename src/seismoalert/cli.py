@@ -8,6 +8,7 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import click
+import numpy as np
 
 from seismoalert import __version__
 from seismoalert.alerts import (
@@ -21,6 +22,17 @@ from seismoalert.client import USGSClient, USGSClientError
 from seismoalert.models import EarthquakeCatalog
 from seismoalert.visualizer import create_earthquake_map
 
+CSV_FIELDNAMES = (
+    "id",
+    "time_utc",
+    "latitude",
+    "longitude",
+    "depth_km",
+    "magnitude",
+    "place",
+    "url",
+)
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="seismoalert")
@@ -35,33 +47,22 @@ def _write_catalog_csv(catalog: EarthquakeCatalog, output_csv: str) -> Path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(
-            csvfile,
-            fieldnames=[
-                "id",
-                "time_utc",
-                "latitude",
-                "longitude",
-                "depth_km",
-                "magnitude",
-                "place",
-                "url",
-            ],
-        )
-        writer.writeheader()
-        for eq in catalog:
-            writer.writerow(
-                {
-                    "id": eq.id,
-                    "time_utc": eq.time.strftime("%Y-%m-%d %H:%M:%S UTC"),
-                    "latitude": eq.latitude,
-                    "longitude": eq.longitude,
-                    "depth_km": eq.depth,
-                    "magnitude": eq.magnitude,
-                    "place": eq.place,
-                    "url": eq.url,
-                }
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(
+            (
+                eq.id,
+                f"{eq.time.year:04d}-{eq.time.month:02d}-{eq.time.day:02d} "
+                f"{eq.time.hour:02d}:{eq.time.minute:02d}:{eq.time.second:02d} UTC",
+                eq.latitude,
+                eq.longitude,
+                eq.depth,
+                eq.magnitude,
+                eq.place,
+                eq.url,
             )
+            for eq in catalog
+        )
 
     return output_path.resolve()
 
@@ -99,7 +100,8 @@ def fetch(days: int, min_magnitude: float, limit: int, output_csv: str):
         click.echo(f"Error: {exc}", err=True)
         sys.exit(1)
 
-    msg = f"Fetched {len(catalog)} earthquakes "
+    n = len(catalog)
+    msg = f"Fetched {n} earthquakes "
     msg += f"(M>={min_magnitude}, last {days} day(s))"
     click.echo(msg)
     try:
@@ -107,16 +109,19 @@ def fetch(days: int, min_magnitude: float, limit: int, output_csv: str):
     except OSError as exc:
         click.echo(f"Error writing CSV: {exc}", err=True)
         sys.exit(1)
-    click.echo(f"Saved {len(catalog)} events to {output_path}")
+    click.echo(f"Saved {n} events to {output_path}")
 
-    if len(catalog) > 0:
+    if n > 0:
         click.echo(f"Largest event: M{catalog.max_magnitude:.1f}")
-        sorted_cat = catalog.sort_by_magnitude()
         click.echo("\nTop events:")
-        for eq in list(sorted_cat)[:5]:
+        # Stable sort keeps the earlier event first among equal magnitudes
+        top = np.argsort(-catalog.magnitudes_array, kind="stable")[:5]
+        for eq in (catalog[int(i)] for i in top):
+            t = eq.time
             click.echo(
                 f"  M{eq.magnitude:.1f}  {eq.place}  "
-                f"({eq.time.strftime('%Y-%m-%d %H:%M UTC')})"
+                f"({t.year:04d}-{t.month:02d}-{t.day:02d} "
+                f"{t.hour:02d}:{t.minute:02d} UTC)"
             )
 
 
@@ -146,9 +151,10 @@ def analyze(days: int, min_magnitude: float, window_days: int):
         click.echo(f"Error: {exc}", err=True)
         sys.exit(1)
 
-    click.echo(f"Analyzing {len(catalog)} earthquakes over {days} days...")
+    n = len(catalog)
+    click.echo(f"Analyzing {n} earthquakes over {days} days...")
 
-    if len(catalog) < 2:
+    if n < 2:
         click.echo("Insufficient data for analysis.")
         return
 
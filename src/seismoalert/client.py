@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+import importlib.util
 from datetime import UTC, datetime, timedelta
 
 import requests
+import urllib3
+from urllib3.util.retry import Retry
 
 from seismoalert.models import EarthquakeCatalog
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as _json_loads
+
+# Whether the optional ijson package needed for streaming is installed
+_HAVE_IJSON = importlib.util.find_spec("ijson") is not None
+
 DEFAULT_BASE_URL = "https://earthquake.usgs.gov/fdsnws/event/1/query"
 DEFAULT_TIMEOUT = 30
+DEFAULT_CACHE_NAME = ".seismoalert_cache"
+DEFAULT_CACHE_EXPIRE = 300
+
+# HTTP statuses that are worth retrying (rate limiting and server errors)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Query parameters that are the same for every request
+_STATIC_QUERY = "format=geojson&orderby=time"
 
 
 class USGSClientError(Exception):
@@ -22,7 +41,18 @@ class USGSClient:
     Args:
         base_url: API endpoint URL.
         timeout: Request timeout in seconds.
-        max_retries: Number of retries on transient failures.
+        max_retries: Number of retries on connection errors and on 429
+            and 5xx responses, with exponential backoff between attempts.
+        cache: If True, cache responses of identical queries on disk for
+            ``cache_expire`` seconds. Requires the optional
+            ``requests-cache`` package; ignored if it is not installed.
+        cache_name: SQLite cache file path (without extension).
+        cache_expire: Cache lifetime of a response in seconds.
+        stream: If True, parse responses incrementally instead of loading
+            the whole JSON document into memory. This lowers peak memory for
+            very large queries but parses more slowly. Requires the optional
+            ``ijson`` package; ignored if it is not installed or if
+            ``cache`` is enabled.
     """
 
     def __init__(
@@ -30,12 +60,32 @@ class USGSClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = 3,
+        cache: bool = False,
+        cache_name: str = DEFAULT_CACHE_NAME,
+        cache_expire: int = DEFAULT_CACHE_EXPIRE,
+        stream: bool = False,
     ):
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(max_retries=max_retries)
+        self.session = _make_session(cache, cache_name, cache_expire)
+        # A caching session reads the whole body to store it, so there is
+        # nothing left to stream-parse.
+        self._stream = stream and _HAVE_IJSON and type(self.session) is requests.Session
+        # Retry transient server errors as well as connection failures,
+        # backing off exponentially between attempts.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        # The client only ever talks to one host from one thread, so a single
+        # pooled keep-alive connection is all it needs.
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=retry, pool_connections=1, pool_maxsize=1
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -71,27 +121,31 @@ class USGSClient:
         if starttime is None:
             starttime = endtime - timedelta(days=1)
 
-        params: dict = {
-            "format": "geojson",
-            "starttime": starttime.strftime("%Y-%m-%dT%H:%M:%S"),
-            "endtime": endtime.strftime("%Y-%m-%dT%H:%M:%S"),
-            "limit": limit,
-            "orderby": "time",
-        }
+        query = (
+            f"{_STATIC_QUERY}"
+            f"&starttime={_format_query_time(starttime)}"
+            f"&endtime={_format_query_time(endtime)}"
+            f"&limit={limit}"
+        )
 
         # Avoid sending unset params for cleaner API requests.
         if min_magnitude is not None:
-            params["minmagnitude"] = min_magnitude
+            query += f"&minmagnitude={min_magnitude}"
         if max_magnitude is not None:
-            params["maxmagnitude"] = max_magnitude
+            query += f"&maxmagnitude={max_magnitude}"
         if min_depth is not None:
-            params["mindepth"] = min_depth
+            query += f"&mindepth={min_depth}"
         if max_depth is not None:
-            params["maxdepth"] = max_depth
+            query += f"&maxdepth={max_depth}"
 
+        # Append to any query string that base_url already carries.
+        separator = "&" if "?" in self.base_url else "?"
+        stream = self._stream
         try:
             response = self.session.get(
-                self.base_url, params=params, timeout=self.timeout
+                f"{self.base_url}{separator}{query}",
+                timeout=self.timeout,
+                stream=stream,
             )
             response.raise_for_status()
         except (requests.exceptions.RequestException, ConnectionError) as exc:
@@ -99,9 +153,43 @@ class USGSClient:
                 f"Failed to fetch earthquake data: {exc}"
             ) from exc
 
+        if stream:
+            with response:
+                response.raw.decode_content = True
+                try:
+                    return EarthquakeCatalog.from_geojson_stream(response.raw)
+                except ValueError as exc:
+                    raise USGSClientError(f"Invalid JSON response: {exc}") from exc
+                except urllib3.exceptions.HTTPError as exc:
+                    raise USGSClientError(
+                        f"Failed to fetch earthquake data: {exc}"
+                    ) from exc
+
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except ValueError as exc:
             raise USGSClientError(f"Invalid JSON response: {exc}") from exc
 
         return EarthquakeCatalog.from_geojson(data)
+
+
+def _format_query_time(time: datetime) -> str:
+    """Format a datetime as the second-resolution ISO 8601 string USGS expects."""
+    return time.replace(tzinfo=None, microsecond=0).isoformat()
+
+
+def _make_session(cache: bool, cache_name: str, cache_expire: int) -> requests.Session:
+    """Create a plain or, if requested and available, a caching session."""
+    if cache:
+        try:
+            import requests_cache
+        except ImportError:
+            pass
+        else:
+            return requests_cache.CachedSession(
+                cache_name=cache_name,
+                backend="sqlite",
+                expire_after=cache_expire,
+                allowable_methods=("GET",),
+            )
+    return requests.Session()
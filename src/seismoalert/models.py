@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import cached_property
+from typing import BinaryIO
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Earthquake:
     """Represents a single earthquake event.
 
@@ -54,15 +60,79 @@ class Earthquake:
         )
 
 
-@dataclass
 class EarthquakeCatalog:
     """A collection of earthquake events with filtering and sorting helpers.
 
-    Attributes:
-        earthquakes: List of Earthquake objects.
+    Events are stored column-wise in read-only NumPy arrays, so filters,
+    sorts and aggregate statistics run as vectorized array operations.
+    ``Earthquake`` objects are only created when the catalog is iterated
+    or indexed. Catalogs are immutable: helpers return a new catalog, or
+    the same one when nothing changes (e.g. sorting a sorted catalog).
+
+    Args:
+        earthquakes: Earthquake objects to store.
     """
 
-    earthquakes: list[Earthquake] = field(default_factory=list)
+    def __init__(self, earthquakes: Iterable[Earthquake] | None = None):
+        quakes = list(earthquakes) if earthquakes is not None else []
+        self._set_columns(
+            ids=[eq.id for eq in quakes],
+            times=np.fromiter(
+                (_to_epoch_us(eq.time) for eq in quakes),
+                dtype=np.int64,
+                count=len(quakes),
+            ),
+            lats=[eq.latitude for eq in quakes],
+            lons=[eq.longitude for eq in quakes],
+            depths=[eq.depth for eq in quakes],
+            mags=[eq.magnitude for eq in quakes],
+            places=[eq.place for eq in quakes],
+            urls=[eq.url for eq in quakes],
+        )
+
+    def _set_columns(self, *, ids, times, lats, lons, depths, mags, places, urls):
+        """Store the event columns as read-only arrays.
+
+        ``times`` are microseconds since the Unix epoch (UTC).
+        """
+        self._ids = _frozen(np.array(ids, dtype=object))
+        self._times = _frozen(np.asarray(times, dtype=np.int64).view("datetime64[us]"))
+        self._lats = _frozen(np.asarray(lats, dtype=np.float64))
+        self._lons = _frozen(np.asarray(lons, dtype=np.float64))
+        self._depths = _frozen(np.asarray(depths, dtype=np.float64))
+        self._mags = _frozen(np.asarray(mags, dtype=np.float64))
+        self._places = _frozen(np.array(places, dtype=object))
+        self._urls = _frozen(np.array(urls, dtype=object))
+
+    def __getstate__(self) -> dict[str, np.ndarray]:
+        # Pickle only the columns; NumPy serializes each one as a single
+        # buffer, and cached derived values are recomputed on demand.
+        return {
+            "ids": self._ids,
+            "times": self._times.view(np.int64),
+            "lats": self._lats,
+            "lons": self._lons,
+            "depths": self._depths,
+            "mags": self._mags,
+            "places": self._places,
+            "urls": self._urls,
+        }
+
+    def __setstate__(self, state: dict[str, np.ndarray]) -> None:
+        self._set_columns(**state)
+
+    @classmethod
+    def _from_columns(cls, **columns) -> EarthquakeCatalog:
+        """Build a catalog directly from column arrays (see ``_set_columns``)."""
+        catalog = cls.__new__(cls)
+        catalog._set_columns(**columns)
+        return catalog
+
+    def _take(self, indices: np.ndarray) -> EarthquakeCatalog:
+        """Return a new catalog with the events at ``indices``, in that order."""
+        return EarthquakeCatalog._from_columns(
+            **{name: column[indices] for name, column in self.__getstate__().items()}
+        )
 
     @classmethod
     def from_geojson(cls, geojson: dict) -> EarthquakeCatalog:
@@ -74,18 +144,196 @@ class EarthquakeCatalog:
         Returns:
             An EarthquakeCatalog containing all parsed events.
         """
-        quakes = [
-            Earthquake.from_geojson_feature(f)
-            for f in geojson.get("features", [])
-            if f["properties"].get("mag") is not None
-        ]
-        return cls(earthquakes=quakes)
+        return cls._from_features(geojson.get("features", []))
+
+    @classmethod
+    def from_geojson_stream(cls, fileobj: BinaryIO) -> EarthquakeCatalog:
+        """Stream-parse a USGS GeoJSON document into an EarthquakeCatalog.
+
+        Features are decoded one at a time and appended to typed column
+        buffers, so the whole JSON document is never held in memory.
+        Requires the optional ``ijson`` package.
+
+        Args:
+            fileobj: Binary file-like object with a GeoJSON FeatureCollection.
+
+        Returns:
+            An EarthquakeCatalog containing all parsed events.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        import ijson
+
+        try:
+            return cls._from_feature_stream(
+                ijson.items(fileobj, "features.item", use_float=True)
+            )
+        except ijson.JSONError as exc:
+            raise ValueError(f"Invalid GeoJSON document: {exc}") from exc
+
+    @classmethod
+    def _from_features(cls, features: list[dict]) -> EarthquakeCatalog:
+        """Build a catalog from a list of GeoJSON features.
+
+        Features with a null magnitude are dropped first, then each column is
+        filled in one pass over the remaining features.
+        """
+        features = [f for f in features if f["properties"].get("mag") is not None]
+        n = len(features)
+        props = [f["properties"] for f in features]
+        coords = [f["geometry"]["coordinates"] for f in features]
+        return cls._from_columns(
+            ids=[f["id"] for f in features],
+            times=np.fromiter((p["time"] for p in props), np.int64, count=n) * 1000,
+            lats=np.fromiter((c[1] for c in coords), np.float64, count=n),
+            lons=np.fromiter((c[0] for c in coords), np.float64, count=n),
+            depths=np.fromiter((c[2] for c in coords), np.float64, count=n),
+            mags=np.fromiter((p["mag"] for p in props), np.float64, count=n),
+            places=[p.get("place", "Unknown") for p in props],
+            urls=[p.get("url", "") for p in props],
+        )
+
+    @classmethod
+    def _from_feature_stream(cls, features: Iterable[dict]) -> EarthquakeCatalog:
+        """Build a catalog from GeoJSON features in a single pass.
+
+        Unlike ``_from_features`` this never holds more than one feature, so
+        it suits features that are parsed incrementally. Features with a null
+        magnitude are skipped.
+        """
+        times_ms = array("q")
+        lats, lons, depths, mags = array("d"), array("d"), array("d"), array("d")
+        ids, places, urls = [], [], []
+        for feature in features:
+            props = feature["properties"]
+            mag = props.get("mag")
+            if mag is None:
+                continue
+            lon, lat, depth = feature["geometry"]["coordinates"][:3]
+            ids.append(feature["id"])
+            times_ms.append(props["time"])
+            lats.append(lat)
+            lons.append(lon)
+            depths.append(depth)
+            mags.append(mag)
+            places.append(props.get("place", "Unknown"))
+            urls.append(props.get("url", ""))
+
+        return cls._from_columns(
+            ids=ids,
+            times=np.frombuffer(times_ms, dtype=np.int64) * 1000,
+            lats=np.frombuffer(lats, dtype=np.float64),
+            lons=np.frombuffer(lons, dtype=np.float64),
+            depths=np.frombuffer(depths, dtype=np.float64),
+            mags=np.frombuffer(mags, dtype=np.float64),
+            places=places,
+            urls=urls,
+        )
 
     def __len__(self) -> int:
-        return len(self.earthquakes)
+        return self._mags.size
+
+    def __iter__(self) -> Iterator[Earthquake]:
+        # Convert whole blocks of each column to Python objects at once, which
+        # is much cheaper than indexing the arrays element by element.
+        for start in range(0, len(self), _ITER_BLOCK):
+            block = slice(start, start + _ITER_BLOCK)
+            offsets = self._times[block].view(np.int64).astype("timedelta64[us]")
+            for fields in zip(
+                self._ids[block].tolist(),
+                offsets.tolist(),
+                self._lats[block].tolist(),
+                self._lons[block].tolist(),
+                self._depths[block].tolist(),
+                self._mags[block].tolist(),
+                self._places[block].tolist(),
+                self._urls[block].tolist(),
+                strict=True,
+            ):
+                yield _new_earthquake(*fields)
+
+    def __getitem__(self, index: int | slice) -> Earthquake | EarthquakeCatalog:
+        """Return the event at ``index``, or a sub-catalog for a slice."""
+        if isinstance(index, slice):
+            return self._take(np.arange(len(self))[index])
+        return self._row(range(len(self))[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EarthquakeCatalog):
+            return NotImplemented
+        return all(
+            np.array_equal(mine, theirs)
+            for mine, theirs in zip(self._columns(), other._columns(), strict=True)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"EarthquakeCatalog(<{len(self)} events>)"
+
+    def _columns(self) -> tuple[np.ndarray, ...]:
+        return (
+            self._ids,
+            self._times,
+            self._lats,
+            self._lons,
+            self._depths,
+            self._mags,
+            self._places,
+            self._urls,
+        )
+
+    def _row(self, i: int) -> Earthquake:
+        """Materialize the event at position ``i`` as an Earthquake."""
+        return Earthquake(
+            id=self._ids[i],
+            time=_EPOCH + timedelta(microseconds=int(self._times[i].view(np.int64))),
+            latitude=float(self._lats[i]),
+            longitude=float(self._lons[i]),
+            depth=float(self._depths[i]),
+            magnitude=float(self._mags[i]),
+            place=self._places[i],
+            url=self._urls[i],
+        )
+
+    @property
+    def earthquakes(self) -> list[Earthquake]:
+        """List of all events as Earthquake objects (built on each access)."""
+        return list(self)
+
+    def filter(
+        self,
+        *,
+        min_mag: float | None = None,
+        max_mag: float | None = None,
+        min_depth: float | None = None,
+        max_depth: float | None = None,
+    ) -> EarthquakeCatalog:
+        """Return a new catalog filtered by magnitude and depth ranges.
+
+        All bounds are combined into one mask, so filtering on both
+        magnitude and depth builds a single new catalog.
 
-    def __iter__(self):
-        return iter(self.earthquakes)
+        Args:
+            min_mag: Minimum magnitude (inclusive).
+            max_mag: Maximum magnitude (inclusive).
+            min_depth: Minimum depth in km (inclusive).
+            max_depth: Maximum depth in km (inclusive).
+
+        Returns:
+            Filtered EarthquakeCatalog.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if min_mag is not None:
+            mask &= self._mags >= min_mag
+        if max_mag is not None:
+            mask &= self._mags <= max_mag
+        if min_depth is not None:
+            mask &= self._depths >= min_depth
+        if max_depth is not None:
+            mask &= self._depths <= max_depth
+        return self._take(np.flatnonzero(mask))
 
     def filter_by_magnitude(
         self, min_mag: float | None = None, max_mag: float | None = None
@@ -99,12 +347,7 @@ class EarthquakeCatalog:
         Returns:
             Filtered EarthquakeCatalog.
         """
-        filtered = self.earthquakes
-        if min_mag is not None:
-            filtered = [eq for eq in filtered if eq.magnitude >= min_mag]
-        if max_mag is not None:
-            filtered = [eq for eq in filtered if eq.magnitude <= max_mag]
-        return EarthquakeCatalog(earthquakes=filtered)
+        return self.filter(min_mag=min_mag, max_mag=max_mag)
 
     def filter_by_depth(
         self, min_depth: float | None = None, max_depth: float | None = None
@@ -118,15 +361,10 @@ class EarthquakeCatalog:
         Returns:
             Filtered EarthquakeCatalog.
         """
-        filtered = self.earthquakes
-        if min_depth is not None:
-            filtered = [eq for eq in filtered if eq.depth >= min_depth]
-        if max_depth is not None:
-            filtered = [eq for eq in filtered if eq.depth <= max_depth]
-        return EarthquakeCatalog(earthquakes=filtered)
+        return self.filter(min_depth=min_depth, max_depth=max_depth)
 
     def sort_by_time(self, reverse: bool = False) -> EarthquakeCatalog:
-        """Return a new catalog sorted by event time.
+        """Return a catalog sorted by event time.
 
         Args:
             reverse: If True, sort newest first.
@@ -134,13 +372,10 @@ class EarthquakeCatalog:
         Returns:
             Sorted EarthquakeCatalog.
         """
-        sorted_eqs = sorted(
-            self.earthquakes, key=lambda eq: eq.time, reverse=reverse
-        )
-        return EarthquakeCatalog(earthquakes=sorted_eqs)
+        return self._sorted_by(self._times.view(np.int64), reverse)
 
     def sort_by_magnitude(self, reverse: bool = True) -> EarthquakeCatalog:
-        """Return a new catalog sorted by magnitude.
+        """Return a catalog sorted by magnitude.
 
         Args:
             reverse: If True (default), sort largest first.
@@ -148,20 +383,103 @@ class EarthquakeCatalog:
         Returns:
             Sorted EarthquakeCatalog.
         """
-        return EarthquakeCatalog(
-            earthquakes=sorted(
-                self.earthquakes, key=lambda eq: eq.magnitude, reverse=reverse
-            )
-        )
+        return self._sorted_by(self._mags, reverse)
+
+    def _sorted_by(self, key: np.ndarray, reverse: bool) -> EarthquakeCatalog:
+        """Stable sort of the catalog by a numeric column.
+
+        A catalog that is already in the requested order is returned as is;
+        equal keys keep their relative order in both directions.
+        """
+        if reverse:
+            key = -key
+        if np.all(key[:-1] <= key[1:]):
+            return self
+        return self._take(np.argsort(key, kind="stable"))
+
+    @property
+    def magnitudes_array(self) -> np.ndarray:
+        """Read-only float64 array of all magnitudes in the catalog."""
+        return self._mags
+
+    magnitudes = magnitudes_array  # backward-compatible alias
 
     @property
-    def magnitudes(self) -> list[float]:
-        """List of all magnitudes in the catalog."""
-        return [eq.magnitude for eq in self.earthquakes]
+    def latitudes(self) -> np.ndarray:
+        """Read-only float64 array of epicenter latitudes in degrees."""
+        return self._lats
 
     @property
+    def longitudes(self) -> np.ndarray:
+        """Read-only float64 array of epicenter longitudes in degrees."""
+        return self._lons
+
+    @property
+    def times(self) -> np.ndarray:
+        """Read-only ``datetime64[us]`` array of event times (UTC)."""
+        return self._times
+
+    @cached_property
+    def epoch_seconds(self) -> np.ndarray:
+        """Read-only float64 array of event times as POSIX timestamps."""
+        return _frozen(self._times.view(np.int64) / 1e6)
+
+    @cached_property
     def max_magnitude(self) -> float | None:
         """Maximum magnitude in the catalog, or None if empty."""
-        if not self.earthquakes:
+        if self._mags.size == 0:
             return None
-        return max(eq.magnitude for eq in self.earthquakes)
+        return float(self._mags.max())
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Number of events converted to Python objects at a time while iterating
+_ITER_BLOCK = 4096
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+
+def _new_earthquake(
+    id: str,
+    offset: timedelta,
+    latitude: float,
+    longitude: float,
+    depth: float,
+    magnitude: float,
+    place: str,
+    url: str,
+) -> Earthquake:
+    """Create an Earthquake from trusted column values, bypassing ``__init__``.
+
+    Setting the slots directly skips the frozen dataclass ``__init__``, which
+    matters when a catalog materializes many rows. ``offset`` is the event
+    time relative to the Unix epoch.
+    """
+    eq = _object_new(Earthquake)
+    _object_setattr(eq, "id", id)
+    _object_setattr(eq, "time", _EPOCH + offset)
+    _object_setattr(eq, "latitude", latitude)
+    _object_setattr(eq, "longitude", longitude)
+    _object_setattr(eq, "depth", depth)
+    _object_setattr(eq, "magnitude", magnitude)
+    _object_setattr(eq, "place", place)
+    _object_setattr(eq, "url", url)
+    return eq
+
+
+def _to_epoch_us(time: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch.
+
+    Naive datetimes are interpreted as UTC.
+    """
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=UTC)
+    return (time - _EPOCH) // timedelta(microseconds=1)
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Mark an array read-only and return it."""
+    array.flags.writeable = False
+    return array
@@ -1,33 +1,61 @@
-"""Visualization utilities for earthquake data."""
+"""Visualization utilities for earthquake data.
+
+Folium and Matplotlib are imported on first use rather than at module load,
+so CLI commands that never draw anything do not pay their import cost.
+"""
 
 from __future__ import annotations
 
+import functools
+import io
 from pathlib import Path
 
-import folium
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 
 from seismoalert.models import EarthquakeCatalog
 
-matplotlib.use("Agg")
+# Leaflet onEachFeature callback that attaches the prebuilt popup HTML
+_BIND_POPUP_JS = """
+function(feature, layer) {
+    layer.bindPopup(feature.properties.popup, {maxWidth: 300});
+}
+"""
+
+
+@functools.cache
+def _pyplot():
+    """Import ``matplotlib.pyplot`` with the non-interactive Agg backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _save_figure(fig, output_path: Path) -> None:
+    """Render a figure in memory and write it to disk in a single call.
+
+    The image format is taken from the file extension, defaulting to PNG.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format=output_path.suffix[1:] or "png", dpi=150)
+    output_path.write_bytes(buf.getbuffer())
+
 
+# Lower magnitude bounds of the "yellow", "orange" and "red" marker colors
+_COLOR_THRESHOLDS = np.array([3.0, 5.0, 7.0])
+_COLORS = np.array(["green", "yellow", "orange", "red"])
 
-def _magnitude_to_color(mag: float) -> str:
-    """Map magnitude to a color string."""
-    if mag >= 7.0:
-        return "red"
-    if mag >= 5.0:
-        return "orange"
-    if mag >= 3.0:
-        return "yellow"
-    return "green"
 
+def _magnitudes_to_colors(mags: np.ndarray) -> np.ndarray:
+    """Map magnitudes to marker color strings."""
+    return _COLORS[np.searchsorted(_COLOR_THRESHOLDS, mags, side="right")]
 
-def _magnitude_to_radius(mag: float) -> float:
-    """Map magnitude to a circle radius in pixels."""
-    return max(3.0, mag ** 2)
+
+def _magnitudes_to_radii(mags: np.ndarray) -> np.ndarray:
+    """Map magnitudes to circle radii in pixels."""
+    return np.maximum(3.0, mags**2)
 
 
 def create_earthquake_map(
@@ -37,7 +65,8 @@ def create_earthquake_map(
     """Create an interactive Folium map of earthquake locations.
 
     Each earthquake is represented as a circle marker with size proportional
-    to magnitude and color indicating severity.
+    to magnitude and color indicating severity. The markers are embedded as
+    a single GeoJSON layer, which keeps the HTML small for large catalogs.
 
     Args:
         catalog: Earthquake catalog to visualize.
@@ -46,12 +75,16 @@ def create_earthquake_map(
     Returns:
         Path to the saved HTML file.
     """
+    import folium
+    from folium.utilities import JsCode
+    from jinja2.utils import htmlsafe_json_dumps
+
     output_path = Path(output_path)
 
     # Center map on mean coordinates, or world center if empty
     if len(catalog) > 0:
-        center_lat = np.mean([eq.latitude for eq in catalog])
-        center_lon = np.mean([eq.longitude for eq in catalog])
+        center_lat = float(catalog.latitudes.mean())
+        center_lon = float(catalog.longitudes.mean())
         zoom = 3
     else:
         center_lat, center_lon = 0.0, 0.0
@@ -59,22 +92,56 @@ def create_earthquake_map(
 
     m = folium.Map(location=[center_lat, center_lon], zoom_start=zoom)
 
-    for eq in catalog:
-        popup_text = (
-            f"<b>M{eq.magnitude:.1f}</b> - {eq.place}<br>"
-            f"Depth: {eq.depth:.1f} km<br>"
-            f"Time: {eq.time.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+    # All markers go into one GeoJSON layer that Leaflet builds client-side;
+    # folium applies each feature's ``style`` property to its marker.
+    mags = catalog.magnitudes_array
+    colors = _magnitudes_to_colors(mags).tolist()
+    radii = _magnitudes_to_radii(mags).tolist()
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [eq.longitude, eq.latitude],
+            },
+            "properties": {
+                "style": {
+                    "radius": radius,
+                    "color": color,
+                    "fillColor": color,
+                },
+                "popup": (
+                    f"<b>M{eq.magnitude:.1f}</b> - {eq.place}<br>"
+                    f"Depth: {eq.depth:.1f} km<br>"
+                    f"Time: {eq.time.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                ),
+            },
+        }
+        for eq, color, radius in zip(catalog, colors, radii, strict=True)
+    ]
+    empty = {"type": "FeatureCollection", "features": []}
+    layer = folium.GeoJson(
+        empty,
+        name="Earthquakes",
+        marker=folium.CircleMarker(fill=True, fill_opacity=0.7),
+        on_each_feature=JsCode(_BIND_POPUP_JS),
+    ).add_to(m)
+
+    # Folium re-parses every rendered script block as a Jinja template, which
+    # is slow for a large inline payload, so the map is rendered with an empty
+    # layer and the features are spliced into its data call afterwards.
+    html = m.get_root().render()
+    add_data = f"{layer.get_name()}_add"
+    placeholder = f"{add_data}({htmlsafe_json_dumps(empty, sort_keys=True)})"
+    if html.count(placeholder) != 1:
+        raise RuntimeError(
+            f"Cannot embed markers: expected one {add_data}(...) call in the "
+            "rendered map; this folium version renders GeoJson differently"
         )
-        folium.CircleMarker(
-            location=[eq.latitude, eq.longitude],
-            radius=_magnitude_to_radius(eq.magnitude),
-            color=_magnitude_to_color(eq.magnitude),
-            fill=True,
-            fill_opacity=0.7,
-            popup=folium.Popup(popup_text, max_width=300),
-        ).add_to(m)
-
-    m.save(str(output_path))
+    payload = htmlsafe_json_dumps({"type": "FeatureCollection", "features": features})
+    html = html.replace(placeholder, f"{add_data}({payload})")
+
+    output_path.write_text(html, encoding="utf-8")
     return output_path
 
 
@@ -92,11 +159,11 @@ def plot_magnitude_time(
         Path to the saved image file.
     """
     output_path = Path(output_path)
-    sorted_cat = catalog.sort_by_time()
-
-    times = [eq.time for eq in sorted_cat]
-    mags = [eq.magnitude for eq in sorted_cat]
+    # A scatter plot does not depend on point order, so no sort is needed.
+    times = catalog.times
+    mags = catalog.magnitudes_array
 
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 5))
     ax.scatter(times, mags, s=10, alpha=0.6, c=mags, cmap="YlOrRd", edgecolors="none")
     ax.set_xlabel("Time")
@@ -104,7 +171,7 @@ def plot_magnitude_time(
     ax.set_title("Earthquake Magnitude vs. Time")
     ax.grid(True, alpha=0.3)
     fig.tight_layout()
-    fig.savefig(str(output_path), dpi=150)
+    _save_figure(fig, output_path)
     plt.close(fig)
 
     return output_path
@@ -134,18 +201,16 @@ def plot_gutenberg_richter(
         Path to the saved image file.
     """
     output_path = Path(output_path)
-    mags = sorted(catalog.magnitudes)
 
-    # Cumulative counts (N >= M)
-    unique_mags = sorted(set(mags))
-    cum_counts = [
-        sum(1 for m in mags if m >= mag) for mag in unique_mags
-    ]
+    # Cumulative counts (N >= M): reverse cumulative sum of per-value counts
+    unique_mags, counts = np.unique(catalog.magnitudes_array, return_counts=True)
+    cum_counts = np.cumsum(counts[::-1])[::-1]
 
     # G-R fit line
-    mag_range = np.linspace(min(mags), max(mags), 100)
+    mag_range = np.linspace(unique_mags[0], unique_mags[-1], 100)
     gr_line = 10 ** (a_value - b_value * mag_range)
 
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(8, 6))
     ax.semilogy(
         unique_mags, cum_counts, "ko", markersize=5, label="Observed"
@@ -173,7 +238,7 @@ def plot_gutenberg_richter(
     ax.legend()
     ax.grid(True, alpha=0.3)
     fig.tight_layout()
-    fig.savefig(str(output_path), dpi=150)
+    _save_figure(fig, output_path)
     plt.close(fig)
 
     return output_path
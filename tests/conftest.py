@@ -4,9 +4,16 @@ from datetime import UTC, datetime
 
 import pytest
 
+from seismoalert import _kernels
 from seismoalert.models import Earthquake, EarthquakeCatalog
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _compiled_kernels() -> None:
+    """Compile the Numba kernels once up front so no single test pays for it."""
+    _kernels.warmup()
+
+
 def _make_feature(
     eq_id: str,
     time_ms: int,
@@ -33,9 +40,12 @@ def _make_feature(
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_geojson() -> dict:
-    """A realistic USGS GeoJSON FeatureCollection with diverse events."""
+    """A realistic USGS GeoJSON FeatureCollection with diverse events.
+
+    Shared by the whole session, so tests must not modify it in place.
+    """
     return {
         "type": "FeatureCollection",
         "metadata": {"generated": 1700000000000, "count": 10},
@@ -84,13 +94,16 @@ def sample_geojson() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_catalog(sample_geojson) -> EarthquakeCatalog:
-    """A pre-built EarthquakeCatalog from the sample GeoJSON."""
+    """A pre-built EarthquakeCatalog from the sample GeoJSON.
+
+    Catalogs are immutable, so one instance is shared by the whole session.
+    """
     return EarthquakeCatalog.from_geojson(sample_geojson)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_earthquake() -> Earthquake:
     """A single sample Earthquake instance."""
     return Earthquake(
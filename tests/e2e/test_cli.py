@@ -1,6 +1,8 @@
 """End-to-end tests for the CLI."""
 
 import csv
+import subprocess
+import sys
 
 import pytest
 import responses
@@ -37,6 +39,18 @@ class TestCLIVersion:
         assert __version__ in result.output
 
 
+class TestCLIImport:
+    def test_import_does_not_load_plotting_libraries(self):
+        code = (
+            "import sys, seismoalert.cli; "
+            "print(sorted({'folium', 'matplotlib'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
 class TestFetchCommand:
     def test_fetch_default(self, runner, mock_api):
         with runner.isolated_filesystem():
@@ -1,11 +1,12 @@
 """Integration tests for the USGS API client."""
 
+import importlib.util
 from datetime import UTC, datetime
 
 import pytest
 import responses
 
-from seismoalert.client import USGSClient, USGSClientError
+from seismoalert.client import DEFAULT_BASE_URL, USGSClient, USGSClientError
 
 pytestmark = pytest.mark.integration
 
@@ -22,6 +23,20 @@ class TestUSGSClient:
         assert len(catalog) == 10
         assert catalog.max_magnitude == 7.2
 
+    @pytest.mark.parametrize("stream", [True, False])
+    @responses.activate
+    def test_fetch_earthquakes_parsing_modes(self, mock_usgs_response, stream):
+        if stream:
+            pytest.importorskip("ijson")
+        catalog = USGSClient(stream=stream).fetch_earthquakes()
+        assert len(catalog) == 10
+        assert catalog.max_magnitude == 7.2
+
+    def test_streaming_is_opt_in(self):
+        assert not USGSClient()._stream
+        if importlib.util.find_spec("ijson") is not None:
+            assert USGSClient(stream=True)._stream
+
     @responses.activate
     def test_fetch_earthquakes_default_times(self, mock_usgs_response):
         client = USGSClient()
@@ -40,6 +55,40 @@ class TestUSGSClient:
         )
         assert len(catalog) == 10  # Mock always returns the same data
 
+    @responses.activate
+    def test_fetch_earthquakes_query_string(self, mock_usgs_response):
+        from urllib.parse import parse_qs, urlsplit
+
+        client = USGSClient()
+        client.fetch_earthquakes(
+            starttime=datetime(2023, 11, 14, 12, 30, 15, 999, tzinfo=UTC),
+            endtime=datetime(2023, 11, 15, tzinfo=UTC),
+            min_magnitude=2.5,
+            max_depth=20.0,
+            limit=50,
+        )
+        query = parse_qs(urlsplit(responses.calls[0].request.url).query)
+        assert query == {
+            "format": ["geojson"],
+            "orderby": ["time"],
+            "starttime": ["2023-11-14T12:30:15"],
+            "endtime": ["2023-11-15T00:00:00"],
+            "limit": ["50"],
+            "minmagnitude": ["2.5"],
+            "maxdepth": ["20.0"],
+        }
+
+    @responses.activate
+    def test_fetch_earthquakes_base_url_with_query(self, mock_usgs_response):
+        from urllib.parse import parse_qs, urlsplit
+
+        client = USGSClient(base_url=f"{DEFAULT_BASE_URL}?eventtype=earthquake")
+        client.fetch_earthquakes(limit=50)
+        query = parse_qs(urlsplit(responses.calls[0].request.url).query)
+        assert query["eventtype"] == ["earthquake"]
+        assert query["format"] == ["geojson"]
+        assert query["limit"] == ["50"]
+
     @responses.activate
     def test_fetch_earthquakes_empty_response(self):
         responses.add(
@@ -77,7 +126,32 @@ class TestUSGSClient:
             client.fetch_earthquakes()
 
     @responses.activate
-    def test_fetch_earthquakes_invalid_json(self):
+    def test_fetch_earthquakes_retries_server_error(self, sample_geojson):
+        url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, json=sample_geojson, status=200)
+        client = USGSClient(max_retries=1)
+        catalog = client.fetch_earthquakes()
+        assert len(catalog) == 10
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_fetch_earthquakes_client_error_not_retried(self):
+        responses.add(
+            responses.GET,
+            "https://earthquake.usgs.gov/fdsnws/event/1/query",
+            status=400,
+        )
+        client = USGSClient(max_retries=3)
+        with pytest.raises(USGSClientError, match="400"):
+            client.fetch_earthquakes()
+        assert len(responses.calls) == 1
+
+    @pytest.mark.parametrize("stream", [True, False])
+    @responses.activate
+    def test_fetch_earthquakes_invalid_json(self, stream):
+        if stream:
+            pytest.importorskip("ijson")
         responses.add(
             responses.GET,
             "https://earthquake.usgs.gov/fdsnws/event/1/query",
@@ -85,7 +159,7 @@ class TestUSGSClient:
             status=200,
             content_type="text/plain",
         )
-        client = USGSClient()
+        client = USGSClient(stream=stream)
         with pytest.raises(USGSClientError, match="Invalid JSON"):
             client.fetch_earthquakes()
 
@@ -107,3 +181,26 @@ class TestUSGSClient:
     def test_custom_timeout(self):
         client = USGSClient(timeout=60)
         assert client.timeout == 60
+
+    def test_session_uses_single_connection_pool(self):
+        adapter = USGSClient().session.get_adapter(DEFAULT_BASE_URL)
+        assert adapter._pool_connections == 1
+        assert adapter._pool_maxsize == 1
+
+    def test_session_is_uncached_by_default(self):
+        import requests
+
+        assert type(USGSClient().session) is requests.Session
+
+    @responses.activate
+    def test_cached_session_reuses_response(self, mock_usgs_response, tmp_path):
+        requests_cache = pytest.importorskip("requests_cache")
+        client = USGSClient(cache=True, cache_name=str(tmp_path / "cache"))
+        assert isinstance(client.session, requests_cache.CachedSession)
+
+        start = datetime(2023, 11, 14, tzinfo=UTC)
+        end = datetime(2023, 11, 15, tzinfo=UTC)
+        first = client.fetch_earthquakes(starttime=start, endtime=end)
+        second = client.fetch_earthquakes(starttime=start, endtime=end)
+        assert first == second
+        assert len(responses.calls) == 1
@@ -1,10 +1,13 @@
 """Integration tests for visualization output."""
 
 
+import numpy as np
 import pytest
 
 from seismoalert.models import EarthquakeCatalog
 from seismoalert.visualizer import (
+    _magnitudes_to_colors,
+    _magnitudes_to_radii,
     create_earthquake_map,
     plot_gutenberg_richter,
     plot_magnitude_time,
@@ -35,6 +38,56 @@ class TestCreateEarthquakeMap:
         # Check that earthquake location data appears in the HTML
         assert "Los Angeles" in content or "CircleMarker" in content
 
+    def test_markers_in_single_geojson_layer(self, sample_catalog, tmp_path):
+        output = tmp_path / "geojson_map.html"
+        create_earthquake_map(sample_catalog, output_path=output)
+        content = output.read_text()
+        assert content.count('"type": "Feature"') == len(sample_catalog)
+        assert "L.circleMarker" not in content
+
+    def test_place_is_not_template_expanded(self, sample_earthquake, tmp_path):
+        import dataclasses
+
+        eq = dataclasses.replace(sample_earthquake, place="{{ 1 + 1 }} </script>")
+        output = tmp_path / "escaped_map.html"
+        create_earthquake_map(EarthquakeCatalog([eq]), output_path=output)
+        content = output.read_text()
+        assert "{{ 1 + 1 }}" in content
+        assert content.count("</script>") == content.count("<script")
+
+    def test_unexpected_render_raises(self, sample_catalog, tmp_path, monkeypatch):
+        from branca.element import Figure
+
+        render = Figure.render
+        monkeypatch.setattr(
+            Figure,
+            "render",
+            lambda self, **kw: render(self, **kw).replace("_add(", "_addData("),
+        )
+        output = tmp_path / "broken_map.html"
+        with pytest.raises(RuntimeError, match="Cannot embed markers"):
+            create_earthquake_map(sample_catalog, output_path=output)
+        assert not output.exists()
+
+
+class TestMarkerStyle:
+    def test_colors_at_thresholds(self):
+        mags = np.array([0.5, 2.99, 3.0, 4.9, 5.0, 6.99, 7.0, 9.1])
+        assert _magnitudes_to_colors(mags).tolist() == [
+            "green",
+            "green",
+            "yellow",
+            "yellow",
+            "orange",
+            "orange",
+            "red",
+            "red",
+        ]
+
+    def test_radii_have_a_floor(self):
+        radii = _magnitudes_to_radii(np.array([0.5, 1.7, 2.0, 6.0]))
+        np.testing.assert_allclose(radii, [3.0, 3.0, 4.0, 36.0])
+
 
 class TestPlotMagnitudeTime:
     def test_generates_image(self, sample_catalog, tmp_path):
@@ -52,6 +105,11 @@ class TestPlotMagnitudeTime:
             header = f.read(4)
         assert header[1:4] == b"PNG"
 
+    def test_format_follows_extension(self, sample_catalog, tmp_path):
+        output = tmp_path / "mag_time.svg"
+        plot_magnitude_time(sample_catalog, output_path=output)
+        assert b"<svg" in output.read_bytes()[:500]
+
 
 class TestPlotGutenbergRichter:
     def test_generates_image(self, sample_catalog, tmp_path):
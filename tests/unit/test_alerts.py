@@ -6,6 +6,7 @@ from seismoalert.alerts import (
     Alert,
     AlertManager,
     AlertRule,
+    CatalogSummary,
     EmailAlert,
     WebhookAlert,
     high_rate_condition,
@@ -47,6 +48,34 @@ class TestAlertRule:
         )
         assert rule.evaluate(catalog) is None
 
+    def test_evaluate_format_spec(self, sample_catalog):
+        rule = AlertRule(
+            name="Formatted",
+            condition=lambda cat: True,
+            message_template="Max magnitude: M{max_mag:.2f}",
+        )
+        alert = rule.evaluate(sample_catalog)
+        assert alert.message == "Max magnitude: M7.20"
+
+    def test_evaluate_static_template(self, sample_catalog):
+        rule = AlertRule(
+            name="Static",
+            condition=lambda cat: True,
+            message_template="Something happened",
+        )
+        assert rule.evaluate(sample_catalog).message == "Something happened"
+
+    def test_evaluate_after_template_change(self, sample_catalog):
+        rule = AlertRule(
+            name="Mutable",
+            condition=lambda cat: True,
+            message_template="Something happened",
+        )
+        assert not rule.uses_summary
+        rule.message_template = "{count} events"
+        assert rule.uses_summary
+        assert rule.evaluate(sample_catalog).message == "10 events"
+
 
 class TestConditionFactories:
     def test_large_earthquake_condition_triggered(self, sample_catalog):
@@ -57,6 +86,10 @@ class TestConditionFactories:
         cond = large_earthquake_condition(9.0)
         assert cond(sample_catalog) is False
 
+    def test_large_earthquake_condition_empty_catalog(self):
+        cond = large_earthquake_condition(0.0)
+        assert cond(EarthquakeCatalog()) is False
+
     def test_high_rate_condition_triggered(self, sample_catalog):
         cond = high_rate_condition(5)
         assert cond(sample_catalog) is True
@@ -65,6 +98,11 @@ class TestConditionFactories:
         cond = high_rate_condition(100)
         assert cond(sample_catalog) is False
 
+    def test_condition_factories_are_cached(self):
+        assert large_earthquake_condition(6.0) is large_earthquake_condition(6.0)
+        assert high_rate_condition(50) is high_rate_condition(50)
+        assert high_rate_condition(50) is not high_rate_condition(51)
+
 
 class TestAlertManager:
     def test_add_and_evaluate(self, sample_catalog):
@@ -105,6 +143,107 @@ class TestAlertManager:
         manager = AlertManager()
         assert manager.evaluate(sample_catalog) == []
 
+    def test_evaluate_parallel(self, sample_catalog):
+        manager = AlertManager()
+        for threshold in (1.0, 6.0, 9.0):
+            manager.add_rule(
+                AlertRule(
+                    name=f"M{threshold}",
+                    condition=large_earthquake_condition(threshold),
+                    message_template="Max magnitude: M{max_mag}",
+                )
+            )
+        alerts = manager.evaluate(sample_catalog, parallel=True)
+        assert [a.rule_name for a in alerts] == ["M1.0", "M6.0"]
+        assert alerts == manager.evaluate(sample_catalog)
+
+    def test_evaluate_summarizes_catalog_once(self, sample_catalog, monkeypatch):
+        calls = []
+        from_catalog = CatalogSummary.from_catalog
+
+        def counting_from_catalog(catalog):
+            calls.append(catalog)
+            return from_catalog(catalog)
+
+        monkeypatch.setattr(CatalogSummary, "from_catalog", counting_from_catalog)
+        manager = AlertManager()
+        manager.add_rule(
+            AlertRule(
+                name="Big Quake",
+                condition=large_earthquake_condition(6.0),
+                message_template="Max magnitude: M{max_mag}",
+            )
+        )
+        manager.add_rule(
+            AlertRule(
+                name="Custom",
+                condition=lambda cat: len(cat) > 5,
+                message_template="{count} events, max M{max_mag}",
+            )
+        )
+        manager.add_rule(
+            AlertRule(
+                name="High Rate",
+                condition=high_rate_condition(100),
+                message_template="{count} events detected",
+            )
+        )
+        alerts = manager.evaluate(sample_catalog)
+        assert len(calls) == 1
+        assert [a.message for a in alerts] == [
+            "Max magnitude: M7.2",
+            "10 events, max M7.2",
+        ]
+
+    def test_evaluate_skips_summary_when_unused(self, sample_catalog, monkeypatch):
+        def fail(catalog):
+            raise AssertionError("summary should not be computed")
+
+        monkeypatch.setattr(CatalogSummary, "from_catalog", fail)
+        manager = AlertManager()
+        manager.add_rule(
+            AlertRule(
+                name="Custom",
+                condition=lambda cat: len(cat) > 5,
+                message_template="Busy period",
+            )
+        )
+        alerts = manager.evaluate(sample_catalog)
+        assert [a.message for a in alerts] == ["Busy period"]
+
+    def test_rule_uses_summary(self):
+        static = AlertRule("A", lambda cat: True, "static")
+        templated = AlertRule("B", lambda cat: True, "{count} events")
+        summarized = AlertRule("C", high_rate_condition(1), "static")
+        assert not static.uses_summary
+        assert templated.uses_summary
+        assert summarized.uses_summary
+
+    def test_malformed_template_on_quiet_rule(self, sample_catalog):
+        manager = AlertManager()
+        manager.add_rule(AlertRule("broken", lambda cat: False, "oops {"))
+        manager.add_rule(AlertRule("fine", lambda cat: True, "fine"))
+        alerts = manager.evaluate(sample_catalog)
+        assert [a.message for a in alerts] == ["fine"]
+
+    def test_malformed_template_raises_when_triggered(self, sample_catalog):
+        manager = AlertManager()
+        manager.add_rule(AlertRule("broken", lambda cat: True, "oops {"))
+        with pytest.raises(ValueError):
+            manager.evaluate(sample_catalog)
+
+
+class TestCatalogSummary:
+    def test_from_catalog(self, sample_catalog):
+        summary = CatalogSummary.from_catalog(sample_catalog)
+        assert summary.count == 10
+        assert summary.max_magnitude == 7.2
+
+    def test_from_empty_catalog(self):
+        summary = CatalogSummary.from_catalog(EarthquakeCatalog())
+        assert summary.count == 0
+        assert summary.max_magnitude is None
+
 
 class TestWebhookAlert:
     def test_send_logs(self, sample_catalog, caplog):
@@ -117,6 +256,52 @@ class TestWebhookAlert:
         assert "Webhook alert" in caplog.text
         assert "Test message" in caplog.text
 
+    def test_send_silent_below_info(self, caplog):
+        import logging
+
+        with caplog.at_level(logging.WARNING):
+            webhook = WebhookAlert(webhook_url="https://hooks.example.com/test")
+            webhook.send(Alert(rule_name="Test", message="Test message"))
+        assert "Webhook alert" not in caplog.text
+
+    def test_send_delivers_in_background(self, monkeypatch):
+        import threading
+
+        delivered = threading.Event()
+        threads = []
+
+        def deliver(self, alert):
+            threads.append(threading.current_thread())
+            delivered.set()
+
+        monkeypatch.setattr(WebhookAlert, "_deliver", deliver)
+        webhook = WebhookAlert(webhook_url="https://hooks.example.com/test")
+        future = webhook.send(Alert(rule_name="Test", message="Test message"))
+        assert future.result(timeout=5) is None
+        assert delivered.is_set()
+        assert threads != [threading.current_thread()]
+
+    def test_failed_delivery_is_logged(self, monkeypatch, caplog):
+        import logging
+        import time
+
+        def deliver(self, alert):
+            raise OSError("connection refused")
+
+        monkeypatch.setattr(WebhookAlert, "_deliver", deliver)
+        webhook = WebhookAlert(webhook_url="https://hooks.example.com/test")
+        with caplog.at_level(logging.ERROR):
+            future = webhook.send(Alert(rule_name="Test", message="Test message"))
+            assert isinstance(future.exception(timeout=5), OSError)
+            # Done-callbacks run on the worker just after the future resolves.
+            deadline = time.monotonic() + 5
+            while not caplog.records and time.monotonic() < deadline:
+                time.sleep(0.01)
+        [record] = caplog.records
+        assert record.levelno == logging.ERROR
+        assert "Failed to deliver alert [Test]" in record.getMessage()
+        assert "connection refused" in record.getMessage()
+
     def test_webhook_url_stored(self):
         webhook = WebhookAlert(webhook_url="https://hooks.example.com/xyz")
         assert webhook.webhook_url == "https://hooks.example.com/xyz"
@@ -133,6 +318,11 @@ class TestEmailAlert:
         assert "Email alert" in caplog.text
         assert "test@example.com" in caplog.text
 
+    def test_send_returns_future(self):
+        email = EmailAlert(recipient="test@example.com")
+        future = email.send(Alert(rule_name="Big Event", message="M7.0 detected"))
+        assert future.result(timeout=5) is None
+
     def test_recipient_stored(self):
         email = EmailAlert(recipient="user@example.com")
         assert email.recipient == "user@example.com"
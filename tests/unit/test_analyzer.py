@@ -1,5 +1,6 @@
 """Unit tests for statistical analysis."""
 
+import math
 from datetime import UTC
 
 import numpy as np
@@ -22,7 +23,7 @@ pytestmark = pytest.mark.unit
 class TestMagnitudeOfCompleteness:
     def test_basic(self, sample_catalog):
         mc = magnitude_of_completeness(sample_catalog)
-        assert isinstance(mc, float)
+        assert type(mc) is float
         assert 1.0 <= mc <= 8.0
 
     def test_empty_catalog(self):
@@ -30,6 +31,51 @@ class TestMagnitudeOfCompleteness:
         with pytest.raises(ValueError, match="empty catalog"):
             magnitude_of_completeness(catalog)
 
+    def test_matches_dict_count(self):
+        from collections import Counter
+        from decimal import ROUND_HALF_UP, Decimal
+
+        from seismoalert.analyzer import _mc_from_mags
+
+        rng = np.random.default_rng(3)
+        mags = np.round(rng.exponential(0.5, 2000) + 0.5, 2)
+        # Independent half-up rounding on the exact decimal representation.
+        counts = Counter(
+            float(Decimal(str(m)).quantize(Decimal("0.1"), ROUND_HALF_UP)) for m in mags
+        )
+        top = max(counts.values())
+        assert _mc_from_mags(mags) == min(m for m, c in counts.items() if c == top)
+
+    def test_halves_round_up(self):
+        from seismoalert.analyzer import _mc_from_mags
+
+        # x.x5 values belong to the bin above; round-half-to-even would put
+        # both 2.25s in the 2.2 bin and report Mc=2.2.
+        mags = np.array([2.25, 2.25, 2.35])
+        assert _mc_from_mags(mags) == 2.3
+
+    def test_modal_bin(self):
+        from datetime import datetime
+
+        from seismoalert.models import Earthquake
+
+        mags = [2.2, 2.3, 2.3, 2.3, 2.4, 2.4, 3.1]
+        quakes = [
+            Earthquake(
+                id=f"eq{i}",
+                time=datetime(2023, 1, 1, tzinfo=UTC),
+                latitude=0,
+                longitude=0,
+                depth=5,
+                magnitude=mag,
+                place="Test",
+                url="",
+            )
+            for i, mag in enumerate(mags)
+        ]
+        catalog = EarthquakeCatalog(earthquakes=quakes)
+        assert magnitude_of_completeness(catalog) == 2.3
+
 
 class TestGutenbergRichter:
     def test_basic_fit(self, sample_catalog):
@@ -38,12 +84,22 @@ class TestGutenbergRichter:
         assert result.b_value > 0
         assert result.a_value > 0
         assert result.mc > 0
+        assert type(result.mc) is float
+        assert type(result.b_value) is float
 
     def test_with_explicit_mc(self, sample_catalog):
         result = gutenberg_richter(sample_catalog, mc=2.0)
         assert result.mc == 2.0
         assert result.b_value > 0
 
+    def test_b_error(self, sample_catalog):
+        result = gutenberg_richter(sample_catalog, mc=2.0)
+        mags = sample_catalog.magnitudes_array
+        mags = mags[mags >= 2.0]
+        expected = 2.3 * result.b_value**2 * mags.std(ddof=1) / math.sqrt(mags.size)
+        assert result.b_error == pytest.approx(expected, abs=2e-3)
+        assert result.b_error > 0
+
     def test_empty_catalog(self):
         catalog = EarthquakeCatalog()
         with pytest.raises(ValueError, match="empty catalog"):
@@ -68,6 +124,16 @@ class TestIntereventTimes:
         # All deltas should be non-negative since events are sorted by time
         assert all(d >= 0 for d in deltas)
 
+    def test_millisecond_deltas_are_exact(self, sample_earthquake):
+        import dataclasses
+        from datetime import timedelta
+
+        later = dataclasses.replace(
+            sample_earthquake, time=sample_earthquake.time + timedelta(milliseconds=1)
+        )
+        catalog = EarthquakeCatalog([later, sample_earthquake])
+        assert interevent_times(catalog).tolist() == [0.001]
+
     def test_too_few_events(self):
         from datetime import datetime
 
@@ -124,6 +190,39 @@ class TestDetectAnomalies:
         catalog = EarthquakeCatalog(earthquakes=[eq])
         assert detect_anomalies(catalog) == []
 
+    def test_detects_burst(self):
+        from datetime import datetime, timedelta
+
+        from seismoalert.models import Earthquake
+
+        t0 = datetime(2023, 1, 1, tzinfo=UTC)
+        # One event per week, then a burst of 10 events within a single day
+        offsets = [timedelta(days=7 * k) for k in range(10)]
+        offsets += [timedelta(days=70, hours=k) for k in range(10)]
+        quakes = [
+            Earthquake(
+                id=f"eq{i}",
+                time=t0 + dt,
+                latitude=0,
+                longitude=0,
+                depth=5,
+                magnitude=3.0,
+                place="Test",
+                url="",
+            )
+            for i, dt in enumerate(offsets)
+        ]
+        anomalies = detect_anomalies(
+            EarthquakeCatalog(earthquakes=quakes), window_days=1
+        )
+        assert anomalies
+        assert anomalies[0].start_index == 10
+        assert anomalies[0].end_index == 19
+        assert anomalies[0].event_count == 10
+        # Newest-first input, as USGS returns it, gives the same periods
+        newest_first = EarthquakeCatalog(earthquakes=quakes[::-1])
+        assert detect_anomalies(newest_first, window_days=1) == anomalies
+
 
 class TestClusteringCoefficient:
     def test_basic(self, sample_catalog):
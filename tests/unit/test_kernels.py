@@ -0,0 +1,166 @@
+"""Unit tests for the numerical kernels."""
+
+import importlib.util
+import math
+
+import numpy as np
+import pytest
+
+from seismoalert import _kernels
+
+pytestmark = pytest.mark.unit
+
+
+def _brute_force_count(lat, lon, t, radius_km, window_s):
+    count = 0
+    for i in range(len(t)):
+        for j in range(i + 1, len(t)):
+            if abs(t[i] - t[j]) > window_s:
+                continue
+            a = (
+                math.sin((lat[j] - lat[i]) / 2) ** 2
+                + math.cos(lat[i])
+                * math.cos(lat[j])
+                * math.sin((lon[j] - lon[i]) / 2) ** 2
+            )
+            if 2 * 6371.0 * math.asin(math.sqrt(a)) <= radius_km:
+                count += 1
+    return count
+
+
+@pytest.fixture
+def random_events():
+    rng = np.random.default_rng(42)
+    n = 200
+    lat = np.radians(rng.uniform(30.0, 40.0, n))
+    lon = np.radians(rng.uniform(-125.0, -115.0, n))
+    t = rng.uniform(0.0, 30 * 86400.0, n)
+    return lat, lon, t
+
+
+class TestCountClustered:
+    def test_matches_brute_force(self, random_events):
+        expected = _brute_force_count(*random_events, 100.0, 86400.0)
+        assert expected > 0
+        assert _kernels.count_clustered(*random_events, 100.0, 86400.0) == expected
+
+    @pytest.mark.parametrize(
+        "impl",
+        [_kernels._count_clustered_numpy, _kernels._count_clustered_loop],
+    )
+    def test_backends_match_brute_force(self, random_events, impl):
+        lat, lon, t = random_events
+        order = np.argsort(t)
+        expected = _brute_force_count(lat, lon, t, 100.0, 86400.0)
+        result = impl(lat[order], lon[order], t[order], 100.0, 86400.0)
+        assert result == expected
+
+    def test_jit_backend_matches_brute_force(self, random_events):
+        pytest.importorskip("numba")
+        lat, lon, t = random_events
+        order = np.argsort(t)
+        expected = _brute_force_count(lat, lon, t, 100.0, 86400.0)
+        kernel = _kernels._jit(_kernels._count_clustered_loop, parallel=True)
+        result = kernel(lat[order], lon[order], t[order], 100.0, 86400.0)
+        assert result == expected
+        assert _kernels.prange is range
+
+    def test_large_input_uses_jit_when_available(self, random_events, monkeypatch):
+        expected = _brute_force_count(*random_events, 100.0, 86400.0)
+        monkeypatch.setattr(_kernels, "_JIT_MIN_EVENTS", 1)
+        assert _kernels.count_clustered(*random_events, 100.0, 86400.0) == expected
+
+    def test_numpy_backend_chunking(self, random_events, monkeypatch):
+        lat, lon, t = random_events
+        order = np.argsort(t)
+        expected = _brute_force_count(lat, lon, t, 100.0, 86400.0)
+        monkeypatch.setattr(_kernels, "_PAIR_CHUNK", 7)
+        result = _kernels._count_clustered_numpy(
+            lat[order], lon[order], t[order], 100.0, 86400.0
+        )
+        assert result == expected
+
+    def test_all_pairs_clustered(self):
+        lat = np.zeros(4)
+        lon = np.zeros(4)
+        t = np.zeros(4)
+        assert _kernels.count_clustered(lat, lon, t, 1.0, 1.0) == 6
+
+    def test_no_pairs_clustered(self, random_events):
+        assert _kernels.count_clustered(*random_events, 0.0, 0.0) == 0
+
+
+class TestMagnitudeMoments:
+    @pytest.fixture
+    def mags(self):
+        rng = np.random.default_rng(11)
+        return np.round(rng.exponential(0.45, 500) + 1.0, 1)
+
+    def test_matches_numpy(self, mags):
+        selected = mags[mags >= 2.0]
+        n, mean, m2 = _kernels.magnitude_moments(mags, 2.0)
+        assert n == selected.size
+        assert mean == pytest.approx(selected.mean())
+        assert m2 == pytest.approx(((selected - selected.mean()) ** 2).sum())
+
+    def test_loop_matches_numpy_backend(self, mags):
+        expected = _kernels.magnitude_moments(mags, 1.5)
+        result = _kernels._magnitude_moments_loop(mags, 1.5)
+        assert result == pytest.approx(expected)
+
+    def test_jit_backend(self, mags, monkeypatch):
+        expected = _kernels.magnitude_moments(mags, 1.5)
+        monkeypatch.setattr(_kernels, "_JIT_MIN_EVENTS", 1)
+        assert _kernels.magnitude_moments(mags, 1.5) == pytest.approx(expected)
+
+    def test_nothing_above_mc(self, mags):
+        assert _kernels.magnitude_moments(mags, 99.0) == (0, 0.0, 0.0)
+
+
+class TestWindowEnds:
+    @pytest.fixture
+    def times(self):
+        rng = np.random.default_rng(5)
+        return np.sort(np.round(rng.uniform(0.0, 1000.0, 300)))
+
+    def test_matches_brute_force(self, times):
+        expected = [int(np.flatnonzero(times <= ti + 25.0).max()) for ti in times]
+        assert _kernels.window_ends(times, 25.0).tolist() == expected
+
+    def test_loop_matches_numpy_backend(self, times):
+        expected = _kernels.window_ends(times, 25.0)
+        result = _kernels._window_ends_loop(times, 25.0)
+        assert result.tolist() == expected.tolist()
+
+    def test_jit_backend(self, times, monkeypatch):
+        expected = _kernels.window_ends(times, 25.0)
+        monkeypatch.setattr(_kernels, "_JIT_MIN_EVENTS", 1)
+        assert _kernels.window_ends(times, 25.0).tolist() == expected.tolist()
+
+
+def test_warmup_compiles_all_kernels():
+    assert _kernels.warmup() is (importlib.util.find_spec("numba") is not None)
+
+
+def test_warmup_covers_read_only_columns():
+    pytest.importorskip("numba")
+    from seismoalert.analyzer import gutenberg_richter
+    from seismoalert.models import EarthquakeCatalog
+
+    _kernels.warmup()
+    kernel = _kernels._jit(_kernels._magnitude_moments_loop)
+    signatures = list(kernel.signatures)
+    n = _kernels._JIT_MIN_EVENTS
+    rng = np.random.default_rng(5)
+    catalog = EarthquakeCatalog._from_columns(
+        ids=np.zeros(n, dtype=object),
+        times=np.zeros(n, dtype=np.int64),
+        lats=np.zeros(n),
+        lons=np.zeros(n),
+        depths=np.zeros(n),
+        mags=np.round(rng.exponential(0.5, n) + 1.0, 1),
+        places=np.zeros(n, dtype=object),
+        urls=np.zeros(n, dtype=object),
+    )
+    gutenberg_richter(catalog)
+    assert list(kernel.signatures) == signatures
@@ -1,5 +1,6 @@
 """Unit tests for data models."""
 
+import numpy as np
 import pytest
 
 from seismoalert.models import Earthquake, EarthquakeCatalog
@@ -15,6 +16,13 @@ class TestEarthquake:
         assert sample_earthquake.longitude == -118.0
         assert sample_earthquake.depth == 10.0
 
+    def test_is_slotted_and_frozen(self, sample_earthquake):
+        import dataclasses
+
+        assert not hasattr(sample_earthquake, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_earthquake.magnitude = 6.0
+
     def test_from_geojson_feature(self):
         feature = {
             "type": "Feature",
@@ -83,6 +91,36 @@ class TestEarthquakeCatalog:
         catalog = EarthquakeCatalog.from_geojson({"features": []})
         assert len(catalog) == 0
 
+    def test_from_geojson_stream(self, sample_geojson, sample_catalog):
+        import io
+        import json
+
+        pytest.importorskip("ijson")
+        stream = io.BytesIO(json.dumps(sample_geojson).encode())
+        assert EarthquakeCatalog.from_geojson_stream(stream) == sample_catalog
+
+    def test_from_geojson_stream_matches_list_parser(self, sample_geojson):
+        import io
+        import json
+
+        pytest.importorskip("ijson")
+        features = sample_geojson["features"]
+        null_mag = dict(features[0], id="null_mag")
+        null_mag["properties"] = dict(null_mag["properties"], mag=None)
+        geojson = dict(sample_geojson, features=[null_mag, *features])
+
+        stream = io.BytesIO(json.dumps(geojson).encode())
+        streamed = EarthquakeCatalog.from_geojson_stream(stream)
+        assert streamed == EarthquakeCatalog.from_geojson(geojson)
+        assert len(streamed) == len(features)
+
+    def test_from_geojson_stream_invalid(self):
+        import io
+
+        pytest.importorskip("ijson")
+        with pytest.raises(ValueError, match="Invalid GeoJSON"):
+            EarthquakeCatalog.from_geojson_stream(io.BytesIO(b"not json"))
+
     def test_filter_by_magnitude(self, sample_catalog):
         filtered = sample_catalog.filter_by_magnitude(min_mag=4.0)
         assert all(eq.magnitude >= 4.0 for eq in filtered)
@@ -104,6 +142,34 @@ class TestEarthquakeCatalog:
         filtered = sample_catalog.filter_by_depth(max_depth=8.0)
         assert all(eq.depth <= 8.0 for eq in filtered)
 
+    def test_filter_combined(self, sample_catalog):
+        filtered = sample_catalog.filter(min_mag=2.0, max_depth=15.0)
+        chained = sample_catalog.filter_by_magnitude(min_mag=2.0).filter_by_depth(
+            max_depth=15.0
+        )
+        assert filtered == chained
+        assert all(eq.magnitude >= 2.0 and eq.depth <= 15.0 for eq in filtered)
+
+    @pytest.mark.parametrize(
+        ("min_mag", "max_mag"),
+        [(None, None), (3.1, None), (None, 3.1), (2.0, 5.2), (5.3, 5.25), (9.0, None)],
+    )
+    def test_filter_by_magnitude_keeps_order(self, sample_catalog, min_mag, max_mag):
+        mags = sample_catalog.magnitudes_array
+        mask = np.ones(mags.size, dtype=bool)
+        if min_mag is not None:
+            mask &= mags >= min_mag
+        if max_mag is not None:
+            mask &= mags <= max_mag
+        expected = [
+            eq.id for eq, keep in zip(sample_catalog, mask, strict=True) if keep
+        ]
+        filtered = sample_catalog.filter_by_magnitude(min_mag=min_mag, max_mag=max_mag)
+        assert [eq.id for eq in filtered] == expected
+
+    def test_filter_no_bounds(self, sample_catalog):
+        assert sample_catalog.filter() == sample_catalog
+
     def test_sort_by_time(self, sample_catalog):
         sorted_cat = sample_catalog.sort_by_time()
         times = [eq.time for eq in sorted_cat]
@@ -119,11 +185,68 @@ class TestEarthquakeCatalog:
         mags = [eq.magnitude for eq in sorted_cat]
         assert mags == sorted(mags, reverse=True)
 
+    def test_sort_already_sorted_returns_same_catalog(self, sample_catalog):
+        by_time = sample_catalog.sort_by_time()
+        assert by_time.sort_by_time() is by_time
+        newest_first = sample_catalog.sort_by_time(reverse=True)
+        assert newest_first.sort_by_time(reverse=True) is newest_first
+
+    def test_sort_by_magnitude_ties_are_stable(self, sample_earthquake):
+        import dataclasses
+
+        quakes = [
+            dataclasses.replace(sample_earthquake, id=eq_id, magnitude=mag)
+            for eq_id, mag in [("a", 3.0), ("b", 5.0), ("c", 3.0), ("d", 5.0)]
+        ]
+        catalog = EarthquakeCatalog(quakes)
+        assert [eq.id for eq in catalog.sort_by_magnitude()] == ["b", "d", "a", "c"]
+        assert [eq.id for eq in catalog.sort_by_magnitude(reverse=False)] == [
+            "a",
+            "c",
+            "b",
+            "d",
+        ]
+
     def test_magnitudes_property(self, sample_catalog):
         mags = sample_catalog.magnitudes
         assert len(mags) == 10
         assert all(isinstance(m, float) for m in mags)
 
+    def test_magnitudes_array(self, sample_catalog):
+        mags = sample_catalog.magnitudes_array
+        assert isinstance(mags, np.ndarray)
+        assert mags.dtype == np.float64
+        assert sample_catalog.magnitudes_array is mags
+
+    def test_magnitudes_array_read_only(self, sample_catalog):
+        with pytest.raises(ValueError):
+            sample_catalog.magnitudes_array[0] = 0.0
+
+    def test_magnitudes_array_empty(self):
+        assert EarthquakeCatalog().magnitudes_array.shape == (0,)
+
+    def test_coordinate_arrays(self, sample_catalog):
+        assert sample_catalog.latitudes.tolist() == [
+            eq.latitude for eq in sample_catalog
+        ]
+        assert sample_catalog.longitudes.tolist() == [
+            eq.longitude for eq in sample_catalog
+        ]
+        assert not sample_catalog.latitudes.flags.writeable
+        assert not sample_catalog.longitudes.flags.writeable
+
+    def test_times(self, sample_catalog):
+        times = sample_catalog.times
+        assert times.dtype == np.dtype("datetime64[us]")
+        assert times[0] == np.datetime64("2023-11-14T22:13:20")
+
+    def test_epoch_seconds(self, sample_catalog):
+        times = sample_catalog.epoch_seconds
+        assert times.dtype == np.float64
+        assert times.tolist() == [eq.time.timestamp() for eq in sample_catalog]
+        assert times[0] == 1700000000.0
+        assert not times.flags.writeable
+
     def test_max_magnitude(self, sample_catalog):
         assert sample_catalog.max_magnitude == 7.2
 
@@ -134,3 +257,53 @@ class TestEarthquakeCatalog:
     def test_iteration(self, sample_catalog):
         count = sum(1 for _ in sample_catalog)
         assert count == 10
+
+    def test_iteration_matches_indexing(self, sample_catalog, monkeypatch):
+        from seismoalert import models
+
+        monkeypatch.setattr(models, "_ITER_BLOCK", 3)
+        events = list(sample_catalog)
+        assert events == [sample_catalog[i] for i in range(len(sample_catalog))]
+        assert all(type(eq.latitude) is float for eq in events)
+        assert events[0].time.tzinfo is not None
+
+    def test_construct_from_earthquakes(self, sample_earthquake):
+        catalog = EarthquakeCatalog(earthquakes=[sample_earthquake])
+        assert len(catalog) == 1
+        assert catalog[0] == sample_earthquake
+
+    def test_getitem(self, sample_catalog):
+        first = sample_catalog[0]
+        assert isinstance(first, Earthquake)
+        assert first.id == "eq001"
+        assert sample_catalog[-1].id == "eq010"
+        with pytest.raises(IndexError):
+            sample_catalog[10]
+
+    def test_getitem_slice(self, sample_catalog):
+        head = sample_catalog[:3]
+        assert isinstance(head, EarthquakeCatalog)
+        assert [eq.id for eq in head] == ["eq001", "eq002", "eq003"]
+
+    def test_pickle_round_trip(self, sample_catalog):
+        import pickle
+
+        assert sample_catalog.max_magnitude is not None  # populate the cache
+        restored = pickle.loads(pickle.dumps(sample_catalog))
+        assert restored == sample_catalog
+        assert "max_magnitude" not in vars(restored)
+        assert not restored.magnitudes_array.flags.writeable
+        assert restored.times.dtype == np.dtype("datetime64[us]")
+
+    def test_round_trip_through_earthquakes(self, sample_catalog):
+        rebuilt = EarthquakeCatalog(earthquakes=sample_catalog.earthquakes)
+        assert rebuilt == sample_catalog
+        assert list(rebuilt) == list(sample_catalog)
+
+    def test_naive_times_are_utc(self, sample_earthquake):
+        from dataclasses import replace
+
+        naive_time = sample_earthquake.time.replace(tzinfo=None)
+        naive = replace(sample_earthquake, time=naive_time)
+        catalog = EarthquakeCatalog(earthquakes=[naive])
+        assert catalog[0].time == sample_earthquake.time